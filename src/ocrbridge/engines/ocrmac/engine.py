@@ -1,13 +1,17 @@
 """ocrmac OCR engine implementation - macOS only."""
 
 import importlib
+import os
 import platform
-import tempfile
-import xml.etree.ElementTree as ET
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from functools import cache, partial
 from pathlib import Path
-from typing import Sequence, Tuple
+from types import ModuleType
+from typing import Callable, Generator, Iterable, Iterator, Sequence, Tuple
 
-from pdf2image import convert_from_path  # type: ignore[reportUnknownVariableType]
+import pypdfium2 as pdfium
 from PIL import Image
 
 from ocrbridge.core import (  # type: ignore[reportMissingTypeStubs]
@@ -22,6 +26,45 @@ from .models import OcrmacParams, RecognitionLevel  # type: ignore[reportMissing
 Annotation = tuple[str, float, Tuple[float, float, float, float]]
 AbsoluteWord = tuple[int, str, int, int, int, int, int]
 
+_HOCR_PREFIX = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" '
+    '"http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">\n'
+    '<html xmlns="http://www.w3.org/1999/xhtml"><head>'
+    '<meta http-equiv="content-type" content="text/html; charset=utf-8" />'
+    '<meta name="ocr-system" content="ocrmac" />'
+    "</head><body>"
+)
+_HOCR_SUFFIX = "</body></html>"
+_XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+# Rendered PDF pages allowed to wait for a free page worker, across all documents
+# an engine processes. Pages being recognized are bounded by the page pool itself.
+_MAX_PENDING_PAGES = 2
+
+# PDFium is not thread-safe, and process_many renders several PDFs at once, so
+# every pypdfium2 call in this module runs under this lock
+_PDFIUM_LOCK = threading.Lock()
+
+
+@cache
+def _load_ocrmac() -> ModuleType:
+    """Import ocrmac on first use and reuse the module afterwards."""
+    try:
+        return importlib.import_module("ocrmac.ocrmac")
+    except ImportError as e:
+        raise OCRProcessingError("ocrmac not installed. Install with: pip install ocrmac") from e
+
+
+def _ocr_kwargs(params: OcrmacParams) -> dict[str, object]:
+    """Build the ocrmac.OCR keyword arguments for the requested recognition level."""
+    kwargs: dict[str, object] = {"language_preference": params.languages}
+    if params.recognition_level == RecognitionLevel.LIVETEXT:
+        kwargs["framework"] = "livetext"
+    elif params.recognition_level != RecognitionLevel.BALANCED:
+        kwargs["recognition_level"] = params.recognition_level.value
+    return kwargs
+
 
 class OcrmacEngine(OCREngine):
     """ocrmac OCR engine implementation.
@@ -32,6 +75,34 @@ class OcrmacEngine(OCREngine):
 
     __param_model__ = OcrmacParams
 
+    def __init__(
+        self,
+        *,
+        _platform_system: Callable[[], str] | None = None,
+        _mac_ver: Callable[[], tuple[str, tuple[str, str, str], str]] | None = None,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            _platform_system: Platform name probe, defaults to platform.system (for tests)
+            _mac_ver: macOS version probe, defaults to platform.mac_ver (for tests)
+        """
+        # Shared by every page and document this engine processes, so nested
+        # document/page pools never run more Vision requests than there are cores
+        self._page_workers = os.cpu_count() or 1
+        self._recognition_slots = threading.BoundedSemaphore(self._page_workers)
+        # One page pool and one pending-page bound for every PDF this engine
+        # processes, so a batch cannot multiply OCR threads or rendered pages
+        self._page_executor = ThreadPoolExecutor(
+            max_workers=self._page_workers, thread_name_prefix="ocrmac-page"
+        )
+        self._pending_pages = threading.BoundedSemaphore(_MAX_PENDING_PAGES)
+        self._warmed_levels: set[RecognitionLevel] = set()
+        # The platform cannot change while the process runs, so probe it once
+        # here instead of on every process() call
+        self._system = (_platform_system or platform.system)()
+        self._mac_version = (_mac_ver or platform.mac_ver)()[0]
+
     @property
     def name(self) -> str:
         """Return engine name."""
@@ -44,9 +115,9 @@ class OcrmacEngine(OCREngine):
 
     def _validate_platform(self) -> None:
         """Validate that we're running on macOS."""
-        if platform.system() != "Darwin":
+        if self._system != "Darwin":
             raise OCRProcessingError(
-                f"ocrmac is only available on macOS systems. Current platform: {platform.system()}"
+                f"ocrmac is only available on macOS systems. Current platform: {self._system}"
             )
 
     def _validate_livetext_requirement(self, recognition_level: RecognitionLevel) -> None:
@@ -54,7 +125,7 @@ class OcrmacEngine(OCREngine):
         if recognition_level != RecognitionLevel.LIVETEXT:
             return
 
-        mac_version = platform.mac_ver()[0]
+        mac_version = self._mac_version
         if not mac_version:
             raise OCRProcessingError(
                 "Unable to determine macOS version. LiveText requires macOS Sonoma (14.0) or later."
@@ -72,6 +143,43 @@ class OcrmacEngine(OCREngine):
         except (ValueError, IndexError) as e:
             raise OCRProcessingError(f"Invalid macOS version format: {mac_version}") from e
 
+    def _resolve_params(self, params: OCREngineParams | None) -> OcrmacParams:
+        """Return params as OcrmacParams, using defaults if none are provided."""
+        if params is None:
+            return OcrmacParams()
+        if not isinstance(params, OcrmacParams):
+            return OcrmacParams.model_validate(params.model_dump())
+        return params
+
+    def warmup(self, params: OCREngineParams | None = None) -> None:
+        """Load the Vision models up front by recognizing a tiny blank image.
+
+        Vision loads its models lazily on the first request, so calling this once
+        at service startup keeps that cost out of the first real document.
+
+        Args:
+            params: ocrmac parameters selecting the recognition level to warm up
+
+        Raises:
+            OCRProcessingError: If warmup fails or platform requirements not met
+        """
+        self._validate_platform()
+        params = self._resolve_params(params)
+        self._validate_livetext_requirement(params.recognition_level)
+
+        if params.recognition_level in self._warmed_levels:
+            return
+
+        ocrmac = _load_ocrmac()
+        try:
+            ocr_instance = ocrmac.OCR(Image.new("RGB", (32, 32), "white"), **_ocr_kwargs(params))
+            with self._recognition_slots:
+                ocr_instance.recognize()
+        except Exception as e:
+            raise OCRProcessingError(f"ocrmac warmup failed: {e}") from e
+
+        self._warmed_levels.add(params.recognition_level)
+
     def process(self, file_path: Path, params: OCREngineParams | None = None) -> str:
         """Process document using ocrmac and return HOCR XML.
 
@@ -90,10 +198,7 @@ class OcrmacEngine(OCREngine):
         self._validate_platform()
 
         # Use defaults if no params provided
-        if params is None:
-            params = OcrmacParams()
-        elif not isinstance(params, OcrmacParams):
-            params = OcrmacParams.model_validate(params.model_dump())
+        params = self._resolve_params(params)
 
         # Validate LiveText requirements
         self._validate_livetext_requirement(params.recognition_level)
@@ -120,149 +225,182 @@ class OcrmacEngine(OCREngine):
         except Exception as e:
             raise OCRProcessingError(f"ocrmac processing failed: {e}") from e
 
-    def _process_image(self, image_path: Path, params: OcrmacParams) -> str:
-        """Process image with ocrmac."""
-        try:
-            ocrmac = importlib.import_module("ocrmac.ocrmac")
-        except ImportError as e:
-            raise OCRProcessingError(
-                "ocrmac not installed. Install with: pip install ocrmac"
-            ) from e
+    def process_many(
+        self,
+        file_paths: Sequence[Path],
+        params: OCREngineParams | None = None,
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """Process several documents concurrently and return HOCR XML for each.
 
-        # Determine framework
-        framework_type = (
-            "livetext" if params.recognition_level == RecognitionLevel.LIVETEXT else "vision"
-        )
+        Args:
+            file_paths: Paths to image or PDF files
+            params: ocrmac parameters applied to every document
+            max_workers: Maximum number of documents processed at once
+                (defaults to the number of CPU cores)
 
-        # Create OCR instance
-        if params.recognition_level == RecognitionLevel.LIVETEXT:
-            ocr_instance = ocrmac.OCR(
-                str(image_path),
-                language_preference=params.languages,
-                framework=framework_type,
-            )
-        elif params.recognition_level == RecognitionLevel.BALANCED:
-            ocr_instance = ocrmac.OCR(
-                str(image_path),
-                language_preference=params.languages,
-            )
-        else:
-            ocr_instance = ocrmac.OCR(
-                str(image_path),
-                language_preference=params.languages,
-                recognition_level=params.recognition_level.value,
-            )
+        Returns:
+            HOCR XML strings in the same order as file_paths
+
+        Raises:
+            OCRProcessingError: If processing any document fails
+            UnsupportedFormatError: If any file format is not supported
+        """
+        if not file_paths:
+            return []
 
-        # Perform OCR
-        annotations = ocr_instance.recognize()
+        # Pay the model-load cost once, before the workers start in parallel
+        params = self._resolve_params(params)
+        self.warmup(params)
 
-        # Get image dimensions
-        with Image.open(image_path) as img:
-            image_width, image_height = img.size
+        # LiveText needs the calling thread's run loop, so it cannot use worker threads
+        if params.recognition_level == RecognitionLevel.LIVETEXT:
+            return [self.process(file_path, params) for file_path in file_paths]
+
+        workers = max(1, min(max_workers or os.cpu_count() or 1, len(file_paths)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(partial(self.process, params=params), file_paths))
 
-        # Convert to HOCR
-        hocr_content = self._convert_to_hocr(annotations, image_width, image_height, params)
+    def _process_image(self, image_path: Path, params: OcrmacParams) -> str:
+        """Process image with ocrmac."""
+        ocrmac = _load_ocrmac()
 
-        return hocr_content
+        # Open once and hand the image itself to ocrmac instead of the path
+        with Image.open(image_path) as image:
+            return self._wrap_hocr([self._ocr_page_div(ocrmac, image, params, 1)])
 
     def _process_pdf(self, pdf_path: Path, params: OcrmacParams) -> str:
         """Process PDF by converting to images then OCR."""
-        try:
-            ocrmac = importlib.import_module("ocrmac.ocrmac")
-        except ImportError as e:
-            raise OCRProcessingError(
-                "ocrmac not installed. Install with: pip install ocrmac"
-            ) from e
+        ocrmac = _load_ocrmac()
+
+        # Close the renderer on every exit, so a failed page releases the PDF here
+        # instead of whenever garbage collection reaches its traceback
+        with closing(self._render_pdf_pages(pdf_path, params.dpi)) as pages:
+            # ocrmac's livetext_from_image waits on the current thread's CFRunLoop,
+            # so LiveText pages are recognized one by one on the calling thread
+            if params.recognition_level == RecognitionLevel.LIVETEXT:
+                return self._wrap_hocr(
+                    self._ocr_page_div(ocrmac, image, params, page_number)
+                    for page_number, image in enumerate(pages, start=1)
+                )
+
+            # Page divs are already in page order; wrap them in one document
+            return self._wrap_hocr(self._ocr_pdf_pages(ocrmac, pages, params))
+
+    def _ocr_pdf_pages(
+        self, ocrmac: ModuleType, pages: Iterator[Image.Image], params: OcrmacParams
+    ) -> list[str]:
+        """OCR rendered pages on the shared page pool and return their divs in page order.
 
-        # Convert PDF to images
+        Pages are rendered on this thread while the pool OCRs earlier pages. Before
+        rendering a page, wait for one of this document's ``concurrency`` slots and one
+        of the engine's pending-page slots, which is freed once a worker picks the page
+        up. The first failed page stops rendering and cancels pages not yet started.
+        """
+        document_slots = threading.BoundedSemaphore(params.concurrency or self._page_workers)
+        failed = threading.Event()
+        futures: list[Future[str]] = []
+
+        def ocr_page(image: Image.Image, page_number: int) -> str:
+            self._pending_pages.release()
+            return self._ocr_page_div(ocrmac, image, params, page_number)
+
+        def finish(future: Future[str]) -> None:
+            if future.cancelled():
+                self._pending_pages.release()
+            if future.cancelled() or future.exception() is not None:
+                failed.set()
+            document_slots.release()
+
+        try:
+            while True:
+                document_slots.acquire()
+                self._pending_pages.acquire()
+                image = None
+                try:
+                    if not failed.is_set():
+                        image = next(pages, None)
+                finally:
+                    if image is None:
+                        self._pending_pages.release()
+                        document_slots.release()
+                if image is None:
+                    break
+                future = self._page_executor.submit(ocr_page, image, len(futures) + 1)
+                future.add_done_callback(finish)
+                futures.append(future)
+
+            return [future.result() for future in futures]
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _render_pdf_pages(self, pdf_path: Path, dpi: int) -> Generator[Image.Image, None, None]:
+        """Rasterize PDF pages in-process at the given DPI, one at a time and in page order."""
         try:
-            images = convert_from_path(str(pdf_path), dpi=300, thread_count=2)
+            with _PDFIUM_LOCK:
+                pdf = pdfium.PdfDocument(pdf_path)
+                page_count = len(pdf)
+            try:
+                for page_index in range(page_count):
+                    # Hold the lock per page only, so other documents can render in between
+                    with _PDFIUM_LOCK:
+                        page = pdf[page_index]
+                        try:
+                            bitmap = page.render(scale=dpi / 72)  # type: ignore[reportArgumentType]
+                            image: Image.Image = bitmap.to_pil()  # type: ignore[reportUnknownMemberType]
+                            # The default BGR bitmap is copied by to_pil, so free it
+                            # here rather than whenever it is garbage collected
+                            bitmap.close()  # type: ignore[reportUnknownMemberType]
+                        finally:
+                            page.close()
+                    yield image
+            finally:
+                with _PDFIUM_LOCK:
+                    pdf.close()
         except Exception as e:
-            raise OCRProcessingError(f"PDF conversion failed: {e}")
+            raise OCRProcessingError(f"PDF conversion failed: {e}") from e
 
-        # Process each page
-        page_hocr_list: list[str] = []
-        for image in images:
-            # Save temp image
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp_file:
-                temp_path = Path(tmp_file.name)
-                image.save(temp_path, format="PNG")
+    def _ocr_page_div(
+        self,
+        ocrmac: ModuleType,
+        image: Image.Image,
+        params: OcrmacParams,
+        page_number: int,
+    ) -> str:
+        """OCR a single page image and return its HOCR ``ocr_page`` div."""
+        # ocrmac accepts PIL images directly, so the page never touches disk
+        image_width, image_height = image.size
+        ocr_instance = ocrmac.OCR(image, **_ocr_kwargs(params))
 
-            try:
-                # Process page
-                framework_type = (
-                    "livetext"
-                    if params.recognition_level == RecognitionLevel.LIVETEXT
-                    else "vision"
-                )
+        with self._recognition_slots:
+            annotations = ocr_instance.recognize()
 
-                if params.recognition_level == RecognitionLevel.LIVETEXT:
-                    ocr_instance = ocrmac.OCR(
-                        str(temp_path),
-                        language_preference=params.languages,
-                        framework=framework_type,
-                    )
-                elif params.recognition_level == RecognitionLevel.BALANCED:
-                    ocr_instance = ocrmac.OCR(
-                        str(temp_path),
-                        language_preference=params.languages,
-                    )
-                else:
-                    ocr_instance = ocrmac.OCR(
-                        str(temp_path),
-                        language_preference=params.languages,
-                        recognition_level=params.recognition_level.value,
-                    )
+        return self._convert_to_hocr_page_div(annotations, image_width, image_height, page_number)
 
-                annotations = ocr_instance.recognize()
-                image_width, image_height = image.size
+    def _wrap_hocr(self, page_divs: Iterable[str]) -> str:
+        """Wrap page divs in a single XHTML HOCR document."""
+        return _HOCR_PREFIX + "".join(page_divs) + _HOCR_SUFFIX
 
-                page_hocr = self._convert_to_hocr(annotations, image_width, image_height, params)
-                page_hocr_list.append(page_hocr)
-            finally:
-                temp_path.unlink(missing_ok=True)
-
-        # Merge pages
-        if len(page_hocr_list) == 1:
-            return page_hocr_list[0]
-        else:
-            return self._merge_hocr_pages(page_hocr_list)
-
-    def _merge_hocr_pages(self, page_hocr_list: list[str]) -> str:
-        """Merge multiple HOCR pages."""
-        combined_body = ""
-        for page_hocr in page_hocr_list:
-            start = page_hocr.find("<body>")
-            end = page_hocr.find("</body>")
-            if start != -1 and end != -1:
-                combined_body += page_hocr[start + 6 : end]
-
-        return f"""<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-<meta http-equiv="content-type" content="text/html; charset=utf-8" />
-<meta name="ocr-system" content="ocrmac" />
-</head>
-<body>{combined_body}</body>
-</html>"""
-
-    def _to_absolute_word(
+    def _to_absolute_words(
         self,
-        idx: int,
-        annotation: Annotation,
+        annotations: Iterable[Annotation],
         image_width: int,
         image_height: int,
-    ) -> AbsoluteWord:
-        """Convert an OCR annotation to absolute HOCR word data."""
-        text, confidence, bbox = annotation
-
-        x_min = int(bbox[0] * image_width)
-        x_max = int((bbox[0] + bbox[2]) * image_width)
-        y_min = int((1.0 - bbox[1] - bbox[3]) * image_height)
-        y_max = int((1.0 - bbox[1]) * image_height)
-
-        return (idx, text, int(confidence * 100), x_min, y_min, x_max, y_max)
+    ) -> list[AbsoluteWord]:
+        """Convert OCR annotations to absolute HOCR word data in a single pass."""
+        return [
+            (
+                idx,
+                text,
+                int(confidence * 100),
+                int(x * image_width),
+                int((1.0 - y - height) * image_height),
+                int((x + width) * image_width),
+                int((1.0 - y) * image_height),
+            )
+            for idx, (text, confidence, (x, y, width, height)) in enumerate(annotations, start=1)
+        ]
 
     def _group_words_into_lines(self, words: Sequence[AbsoluteWord]) -> list[list[AbsoluteWord]]:
         """Group absolute-position words into visual lines."""
@@ -304,7 +442,7 @@ class OcrmacEngine(OCREngine):
 
     def _convert_to_hocr(
         self,
-        annotations: Sequence[Annotation],
+        annotations: Iterable[Annotation],
         image_width: int,
         image_height: int,
         params: OcrmacParams,
@@ -314,35 +452,36 @@ class OcrmacEngine(OCREngine):
         ocrmac output: [(text, confidence, [x_min, y_min, width, height]), ...]
         where coordinates are relative (0.0-1.0) and from bottom-left origin
         """
-        html = ET.Element("html", xmlns="http://www.w3.org/1999/xhtml")
-
-        # Head
-        head = ET.SubElement(html, "head")
-        ET.SubElement(
-            head,
-            "meta",
-            attrib={"http-equiv": "content-type", "content": "text/html; charset=utf-8"},
-        )
-        ET.SubElement(head, "meta", attrib={"name": "ocr-system", "content": "ocrmac"})
-
-        # Body
-        body = ET.SubElement(html, "body")
-        page = ET.SubElement(
-            body,
-            "div",
-            attrib={
-                "class": "ocr_page",
-                "id": "page_1",
-                "title": f"bbox 0 0 {image_width} {image_height}",
-            },
-        )
+        page_div = self._convert_to_hocr_page_div(annotations, image_width, image_height, 1)
+        return self._wrap_hocr([page_div])
 
-        absolute_words = [
-            self._to_absolute_word(idx, annotation, image_width, image_height)
-            for idx, annotation in enumerate(annotations, start=1)
-        ]
+    def _convert_to_hocr_page_div(
+        self,
+        annotations: Iterable[Annotation],
+        image_width: int,
+        image_height: int,
+        page_number: int,
+    ) -> str:
+        """Convert ocrmac annotations to a single HOCR ``ocr_page`` div."""
+        absolute_words = self._to_absolute_words(annotations, image_width, image_height)
         lines = self._group_words_into_lines(absolute_words)
 
+        return "".join(self._iter_hocr_parts(lines, image_width, image_height, page_number))
+
+    def _iter_hocr_parts(
+        self,
+        lines: Iterable[Sequence[AbsoluteWord]],
+        image_width: int,
+        image_height: int,
+        page_number: int,
+    ) -> Iterator[str]:
+        """Yield HOCR markup fragments for one page's grouped lines, in document order."""
+        # The schema is fixed, so emit markup directly instead of building a DOM
+        yield (
+            f'<div class="ocr_page" id="page_{page_number}" '
+            f'title="bbox 0 0 {image_width} {image_height}">'
+        )
+
         word_counter = 1
         for line_idx, line_words in enumerate(lines, start=1):
             line_x_min = min(word[3] for word in line_words)
@@ -350,32 +489,19 @@ class OcrmacEngine(OCREngine):
             line_x_max = max(word[5] for word in line_words)
             line_y_max = max(word[6] for word in line_words)
 
-            line_elem = ET.SubElement(
-                page,
-                "span",
-                attrib={
-                    "class": "ocr_line",
-                    "id": f"line_1_{line_idx}",
-                    "title": f"bbox {line_x_min} {line_y_min} {line_x_max} {line_y_max}",
-                },
+            yield (
+                f'<span class="ocr_line" id="line_{page_number}_{line_idx}" '
+                f'title="bbox {line_x_min} {line_y_min} {line_x_max} {line_y_max}">'
             )
 
             for _original_idx, text, confidence, x_min, y_min, x_max, y_max in line_words:
-                word_elem = ET.SubElement(
-                    line_elem,
-                    "span",
-                    attrib={
-                        "class": "ocrx_word",
-                        "id": f"word_1_{word_counter}",
-                        "title": f"bbox {x_min} {y_min} {x_max} {y_max}; x_wconf {confidence}",
-                    },
+                yield (
+                    f'<span class="ocrx_word" id="word_{page_number}_{word_counter}" '
+                    f'title="bbox {x_min} {y_min} {x_max} {y_max}; x_wconf {confidence}">'
+                    f"{text.translate(_XML_ESCAPE)}</span>"
                 )
-                word_elem.text = text
                 word_counter += 1
 
-        # Generate HOCR XML
-        xml_declaration = '<?xml version="1.0" encoding="UTF-8"?>'
-        doctype = '<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">'
-        html_content = ET.tostring(html, encoding="unicode", method="xml")
+            yield "</span>"
 
-        return f"{xml_declaration}\n{doctype}\n{html_content}"
+        yield "</div>"
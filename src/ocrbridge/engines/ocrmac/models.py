@@ -51,6 +51,24 @@ class OcrmacParams(OCREngineParams):
         ),
     )
 
+    concurrency: int | None = Field(
+        default=None,
+        description=(
+            "Maximum number of PDF pages recognized in parallel. "
+            "Defaults to the number of CPU cores."
+        ),
+        ge=1,
+        examples=[1, 4],
+    )
+
+    dpi: int = Field(
+        default=200,
+        description="Resolution used to rasterize PDF pages before OCR (72-600).",
+        ge=72,
+        le=600,
+        examples=[150, 200, 300],
+    )
+
     @field_validator("languages")
     @classmethod
     def validate_languages(cls, v: list[str] | None) -> list[str] | None:
@@ -1,5 +1,6 @@
 """Shared pytest fixtures and utilities for tests."""
 
+import re
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Any, Callable
@@ -7,38 +8,55 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from ocrbridge.engines.ocrmac import OcrmacEngine, OcrmacParams
 
-@pytest.fixture
+_BBOX_RE = re.compile(r"bbox\s+(-?\d+)\s+(-?\d+)\s+(-?\d+)\s+(-?\d+)")
+_WCONF_RE = re.compile(r"x_wconf\s+(\d+)")
+
+
+@pytest.fixture(scope="session")
+def engine() -> OcrmacEngine:
+    """Return one engine shared by tests that do not patch its platform probe or methods."""
+    return OcrmacEngine()
+
+
+@pytest.fixture(scope="session")
+def default_params() -> OcrmacParams:
+    """Return default engine parameters shared by tests that do not modify them."""
+    return OcrmacParams()
+
+
+@pytest.fixture(scope="session")
 def samples_dir() -> Path:
     """Return path to samples directory."""
     return Path(__file__).parent.parent / "samples"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_jpg(samples_dir: Path) -> Path:
     """Return path to sample JPG file."""
     return samples_dir / "numbers_gs150.jpg"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_jpg_2(samples_dir: Path) -> Path:
     """Return path to second sample JPG file."""
     return samples_dir / "stock_gs200.jpg"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pdf_en(samples_dir: Path) -> Path:
     """Return path to English contract PDF."""
     return samples_dir / "contract_en_photo.pdf"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pdf_de(samples_dir: Path) -> Path:
     """Return path to German contract PDF."""
     return samples_dir / "contract_de_scan.pdf"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_ocrmac_annotations() -> list[tuple[str, float, tuple[float, float, float, float]]]:
     """Return mock ocrmac annotation data.
 
@@ -73,7 +91,7 @@ def mock_ocrmac_module() -> MagicMock:
     return mock_module
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def hocr_validator() -> Callable[[str], ET.Element]:
     """Return a function to validate and parse HOCR XML."""
 
@@ -124,7 +142,7 @@ def hocr_validator() -> Callable[[str], ET.Element]:
     return validate
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def bbox_parser() -> Callable[[str], dict[str, Any]]:
     """Return a function to parse bbox from HOCR title attribute."""
 
@@ -139,18 +157,15 @@ def bbox_parser() -> Callable[[str], dict[str, Any]]:
         """
         result: dict[str, Any] = {}
 
-        for part in title.split(";"):
-            part = part.strip()
-            if part.startswith("bbox "):
-                coords = part[5:].split()
-                result["bbox"] = {
-                    "x_min": int(coords[0]),
-                    "y_min": int(coords[1]),
-                    "x_max": int(coords[2]),
-                    "y_max": int(coords[3]),
-                }
-            elif part.startswith("x_wconf "):
-                result["confidence"] = int(part[8:])
+        bbox_match = _BBOX_RE.search(title)
+        if bbox_match:
+            result["bbox"] = dict(
+                zip(("x_min", "y_min", "x_max", "y_max"), map(int, bbox_match.group(1, 2, 3, 4)))
+            )
+
+        conf_match = _WCONF_RE.search(title)
+        if conf_match:
+            result["confidence"] = int(conf_match.group(1))
 
         return result
 
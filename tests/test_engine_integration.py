@@ -1,26 +1,158 @@
 """Integration tests for ocrmac engine (requires macOS and ocrmac installed)."""
 
+import io
 import platform
+import re
 import shutil
 import subprocess
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Callable
+from typing import Any, Callable, Iterable, Iterator
 
 import pytest
+from PIL import Image
 
 from ocrbridge.engines.ocrmac import OcrmacEngine, OcrmacParams, RecognitionLevel
 
+NS = {"x": "http://www.w3.org/1999/xhtml"}
+WORD_XPATH = ".//x:span[@class='ocrx_word']"
+PAGE_XPATH = ".//x:div[@class='ocr_page']"
+WORD_TAG = "{http://www.w3.org/1999/xhtml}span"
+# The XML declaration, DOCTYPE and <html> start tag all fit well within this prefix
+HEADER_LEN = 1024
+HEADER_RE = re.compile(
+    r'<\?xml version="1\.0" encoding="UTF-8"\?>\s*'
+    r"<!DOCTYPE html[^>]*XHTML 1\.0 Transitional[^>]*>\s*"
+    r'<html[^>]*xmlns="http://www\.w3\.org/1999/xhtml"'
+)
+
+
+def _iter_words(hocr: str) -> Iterator[ET.Element]:
+    """Stream ocrx_word elements from HOCR without building the whole tree.
+
+    Each element is cleared once the caller moves on, so it must be inspected
+    before requesting the next one.
+    """
+    for _, element in ET.iterparse(io.BytesIO(hocr.encode("utf-8")), events=("end",)):
+        if element.tag == WORD_TAG and element.attrib.get("class") == "ocrx_word":
+            yield element
+            element.clear()
+
+
+def _validate_words(
+    words: Iterable[ET.Element], parse_title: Callable[[str], dict[str, Any]]
+) -> dict[str, list[str]]:
+    """Check bbox, confidence and text of every word in a single traversal.
+
+    Args:
+        words: ocrx_word elements to check
+        parse_title: The bbox_parser fixture, used to read each title attribute
+
+    Returns:
+        Problems found, keyed by "bbox", "confidence" and "text"
+    """
+    errors: dict[str, list[str]] = {"bbox": [], "confidence": [], "text": []}
+
+    for word in words:
+        title = word.get("title")
+        if title is None:
+            errors["bbox"].append(f"Word element has no title: {word.text}")
+            continue
+
+        parsed = parse_title(title)
+        bbox = parsed.get("bbox")
+        if bbox is None:
+            errors["bbox"].append(f"No bbox found in word title: {title}")
+        else:
+            x_min, y_min, x_max, y_max = (bbox[key] for key in ("x_min", "y_min", "x_max", "y_max"))
+            if not (0 <= x_min < x_max and 0 <= y_min < y_max):
+                errors["bbox"].append(f"Invalid bbox: {x_min} {y_min} {x_max} {y_max}")
+
+        confidence = parsed.get("confidence")
+        if confidence is not None and not 0 <= confidence <= 100:
+            errors["confidence"].append(f"Confidence out of range: {confidence}")
+
+        if word.text is None or not word.text.strip():
+            errors["text"].append(f"Word element has empty text: {title}")
+
+    return errors
+
+
 # Skip all tests in this module if not on macOS
 pytestmark = pytest.mark.skipif(
     platform.system() != "Darwin", reason="Integration tests require macOS"
 )
 
 
-@pytest.fixture
-def engine() -> OcrmacEngine:
-    """Create engine instance."""
-    return OcrmacEngine()
+@pytest.fixture(scope="session", autouse=True)
+def _warm_vision(engine: OcrmacEngine) -> None:
+    """Load Vision's models once per worker so no test pays the cold start."""
+    # ocrmac's default level is already "accurate", so warming BALANCED covers ACCURATE too
+    for level in (RecognitionLevel.FAST, RecognitionLevel.BALANCED):
+        engine.warmup(OcrmacParams(recognition_level=level))
+
+
+@pytest.fixture(scope="session")
+def sample_jpg_size(sample_jpg: Path) -> tuple[int, int]:
+    """Return the sample JPG's (width, height)."""
+    with Image.open(sample_jpg) as img:
+        return img.size
+
+
+@pytest.fixture(scope="session")
+def processed_jpg(engine: OcrmacEngine, sample_jpg: Path) -> str:
+    """Process the sample JPG once with default params."""
+    return engine.process(sample_jpg)
+
+
+@pytest.fixture(scope="session")
+def processed_jpg_root(
+    processed_jpg: str, hocr_validator: Callable[[str], ET.Element]
+) -> ET.Element:
+    """Validate the processed sample JPG's HOCR and return its parsed root."""
+    return hocr_validator(processed_jpg)
+
+
+@pytest.fixture(scope="session")
+def jpg_word_errors(
+    processed_jpg: str, bbox_parser: Callable[[str], dict[str, Any]]
+) -> dict[str, list[str]]:
+    """Validate the processed sample JPG's words once for all word checks."""
+    return _validate_words(_iter_words(processed_jpg), bbox_parser)
+
+
+@pytest.fixture(scope="session")
+def processed_jpg_2(engine: OcrmacEngine, sample_jpg_2: Path) -> str:
+    """Process the second sample JPG once with default params."""
+    return engine.process(sample_jpg_2)
+
+
+@pytest.fixture(scope="session")
+def processed_jpg_2_root(
+    processed_jpg_2: str, hocr_validator: Callable[[str], ET.Element]
+) -> ET.Element:
+    """Validate the processed second sample JPG's HOCR and return its parsed root."""
+    return hocr_validator(processed_jpg_2)
+
+
+@pytest.fixture(scope="session")
+def processed_pdf_en(engine: OcrmacEngine, sample_pdf_en: Path) -> str:
+    """Process the English PDF once with default params."""
+    return engine.process(sample_pdf_en)
+
+
+@pytest.fixture(scope="session")
+def processed_pdf_en_root(
+    processed_pdf_en: str, hocr_validator: Callable[[str], ET.Element]
+) -> ET.Element:
+    """Validate the processed English PDF's HOCR and return its parsed root."""
+    return hocr_validator(processed_pdf_en)
+
+
+@pytest.fixture(scope="session")
+def processed_pdf_de(engine: OcrmacEngine, sample_pdf_de: Path) -> str:
+    """Process the German PDF once with German language preference."""
+    return engine.process(sample_pdf_de, OcrmacParams(languages=["de-DE"]))
 
 
 @pytest.mark.integration
@@ -29,134 +161,80 @@ class TestImageProcessing:
 
     def test_process_jpg_image(
         self,
-        engine: OcrmacEngine,
-        sample_jpg: Path,
-        hocr_validator: Callable[[str], ET.Element],
+        processed_jpg_root: ET.Element,
     ) -> None:
         """Test processing a real JPG image."""
-        result = engine.process(sample_jpg)
-
-        # Validate HOCR structure
-        root = hocr_validator(result)
+        # HOCR structure was validated when the root was parsed
+        root = processed_jpg_root
 
         # Check that we have some OCR results
-        words = root.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
-        assert len(words) > 0, "Expected OCR to find some words"
+        assert root.find(WORD_XPATH, NS) is not None, "Expected OCR to find some words"
 
         # Verify page dimensions are present
-        page = root.find(".//{http://www.w3.org/1999/xhtml}div[@class='ocr_page']")
+        page = root.find(PAGE_XPATH, NS)
         assert page is not None
-        assert "bbox" in page.attrib.get("title", "")
+        title = page.get("title")
+        assert title is not None and "bbox" in title
 
     def test_process_second_jpg_image(
         self,
-        engine: OcrmacEngine,
-        sample_jpg_2: Path,
-        hocr_validator: Callable[[str], ET.Element],
+        processed_jpg_2_root: ET.Element,
     ) -> None:
         """Test processing a second JPG image."""
-        result = engine.process(sample_jpg_2)
-
-        # Validate HOCR structure
-        root = hocr_validator(result)
+        # HOCR structure was validated when the root was parsed
+        root = processed_jpg_2_root
 
         # Check that we have OCR results
-        words = root.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
-        assert len(words) > 0, "Expected OCR to find some words"
-
-    def test_process_with_fast_recognition(
-        self,
-        engine: OcrmacEngine,
-        sample_jpg: Path,
-        hocr_validator: Callable[[str], ET.Element],
-    ) -> None:
-        """Test processing with FAST recognition level."""
-        params = OcrmacParams(recognition_level=RecognitionLevel.FAST)
-        result = engine.process(sample_jpg, params)
-
-        # Should return valid HOCR
-        root = hocr_validator(result)
-        words = root.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
-        assert len(words) > 0
-
-    def test_process_with_balanced_recognition(
-        self,
-        engine: OcrmacEngine,
-        sample_jpg: Path,
-        hocr_validator: Callable[[str], ET.Element],
-    ) -> None:
-        """Test processing with BALANCED recognition level (default)."""
-        params = OcrmacParams(recognition_level=RecognitionLevel.BALANCED)
-        result = engine.process(sample_jpg, params)
-
-        # Should return valid HOCR
-        root = hocr_validator(result)
-        words = root.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
-        assert len(words) > 0
-
-    def test_process_with_accurate_recognition(
-        self,
-        engine: OcrmacEngine,
-        sample_jpg: Path,
-        hocr_validator: Callable[[str], ET.Element],
-    ) -> None:
-        """Test processing with ACCURATE recognition level."""
-        params = OcrmacParams(recognition_level=RecognitionLevel.ACCURATE)
-        result = engine.process(sample_jpg, params)
-
-        # Should return valid HOCR
-        root = hocr_validator(result)
-        words = root.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
-        assert len(words) > 0
-
-    def test_process_with_livetext_recognition(
+        assert root.find(WORD_XPATH, NS) is not None, "Expected OCR to find some words"
+
+    @pytest.mark.parametrize(
+        "level",
+        [
+            RecognitionLevel.FAST,
+            RecognitionLevel.BALANCED,
+            RecognitionLevel.ACCURATE,
+            RecognitionLevel.LIVETEXT,
+        ],
+        ids=lambda level: level.value,
+    )
+    def test_process_with_recognition_level(
         self,
         engine: OcrmacEngine,
         sample_jpg: Path,
         hocr_validator: Callable[[str], ET.Element],
         livetext_available: bool,
+        level: RecognitionLevel,
     ) -> None:
-        """Test processing with LIVETEXT recognition level (Sonoma 14.0+ only)."""
-        if not livetext_available:
+        """Test processing with each recognition level (LiveText needs Sonoma 14.0+)."""
+        if level == RecognitionLevel.LIVETEXT and not livetext_available:
             pytest.skip("LiveText not available or not working on this system")
 
-        params = OcrmacParams(recognition_level=RecognitionLevel.LIVETEXT)
+        params = OcrmacParams(recognition_level=level)
         result = engine.process(sample_jpg, params)
 
         # Should return valid HOCR
         root = hocr_validator(result)
-        words = root.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
-        assert len(words) > 0
+        assert root.find(WORD_XPATH, NS) is not None
 
+    @pytest.mark.parametrize(
+        "languages",
+        [["en-US"], ["en-US", "de-DE", "fr-FR"]],
+        ids=["single-language", "multiple-languages"],
+    )
     def test_process_with_language_preference(
         self,
         engine: OcrmacEngine,
         sample_jpg: Path,
         hocr_validator: Callable[[str], ET.Element],
+        languages: list[str],
     ) -> None:
-        """Test processing with language preference."""
-        params = OcrmacParams(languages=["en-US"])
+        """Test processing with one or several language preferences."""
+        params = OcrmacParams(languages=languages)
         result = engine.process(sample_jpg, params)
 
         # Should return valid HOCR
         root = hocr_validator(result)
-        words = root.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
-        assert len(words) > 0
-
-    def test_process_with_multiple_languages(
-        self,
-        engine: OcrmacEngine,
-        sample_jpg: Path,
-        hocr_validator: Callable[[str], ET.Element],
-    ) -> None:
-        """Test processing with multiple language preferences."""
-        params = OcrmacParams(languages=["en-US", "de-DE", "fr-FR"])
-        result = engine.process(sample_jpg, params)
-
-        # Should return valid HOCR
-        root = hocr_validator(result)
-        words = root.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
-        assert len(words) > 0
+        assert root.find(WORD_XPATH, NS) is not None
 
 
 @pytest.mark.integration
@@ -165,60 +243,47 @@ class TestPDFProcessing:
 
     def test_process_english_pdf(
         self,
-        engine: OcrmacEngine,
-        sample_pdf_en: Path,
-        hocr_validator: Callable[[str], ET.Element],
+        processed_pdf_en_root: ET.Element,
     ) -> None:
         """Test processing an English PDF."""
-        result = engine.process(sample_pdf_en)
-
-        # Validate HOCR structure
-        root = hocr_validator(result)
+        # HOCR structure was validated when the root was parsed
+        root = processed_pdf_en_root
 
         # Check that we have OCR results
-        words = root.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
-        assert len(words) > 0, "Expected OCR to find words in PDF"
+        assert root.find(WORD_XPATH, NS) is not None, "Expected OCR to find words in PDF"
 
         # Check for page structure
-        pages = root.findall(".//{http://www.w3.org/1999/xhtml}div[@class='ocr_page']")
-        assert len(pages) > 0, "Expected at least one page"
+        assert root.find(PAGE_XPATH, NS) is not None, "Expected at least one page"
 
     def test_process_german_pdf(
         self,
-        engine: OcrmacEngine,
-        sample_pdf_de: Path,
+        processed_pdf_de: str,
         hocr_validator: Callable[[str], ET.Element],
     ) -> None:
         """Test processing a German PDF."""
-        params = OcrmacParams(languages=["de-DE"])
-        result = engine.process(sample_pdf_de, params)
+        result = processed_pdf_de
 
         # Validate HOCR structure
         root = hocr_validator(result)
 
         # Check that we have OCR results
-        words = root.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
-        assert len(words) > 0, "Expected OCR to find words in German PDF"
+        assert root.find(WORD_XPATH, NS) is not None, "Expected OCR to find words in German PDF"
 
     def test_pdf_multipage_structure(
         self,
-        engine: OcrmacEngine,
-        sample_pdf_en: Path,
-        hocr_validator: Callable[[str], ET.Element],
+        processed_pdf_en_root: ET.Element,
     ) -> None:
         """Test that multi-page PDFs have correct structure."""
-        result = engine.process(sample_pdf_en)
-
-        # Validate HOCR structure
-        root = hocr_validator(result)
+        root = processed_pdf_en_root
 
         # Find all pages
-        pages = root.findall(".//{http://www.w3.org/1999/xhtml}div[@class='ocr_page']")
+        pages = root.findall(PAGE_XPATH, NS)
         assert len(pages) >= 1, "Expected at least one page"
 
         # Each page should have bbox in title
         for page in pages:
-            title = page.attrib.get("title", "")
+            title = page.get("title")
+            assert title is not None, "Page missing title"
             assert "bbox" in title, f"Page missing bbox in title: {title}"
 
     def test_pdf_with_fast_recognition(
@@ -233,8 +298,7 @@ class TestPDFProcessing:
 
         # Should return valid HOCR
         root = hocr_validator(result)
-        words = root.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
-        assert len(words) > 0
+        assert root.find(WORD_XPATH, NS) is not None
 
     def test_pdf_with_accurate_recognition(
         self,
@@ -248,118 +312,68 @@ class TestPDFProcessing:
 
         # Should return valid HOCR
         root = hocr_validator(result)
-        words = root.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
-        assert len(words) > 0
+        assert root.find(WORD_XPATH, NS) is not None
 
 
 @pytest.mark.integration
 class TestHOCROutput:
     """Integration tests for HOCR output validation."""
 
-    def test_hocr_has_xml_declaration(self, engine: OcrmacEngine, sample_jpg: Path) -> None:
-        """Test that HOCR output has XML declaration."""
-        result = engine.process(sample_jpg)
-        assert result.startswith('<?xml version="1.0" encoding="UTF-8"?>')
+    def test_hocr_header(self, processed_jpg: str) -> None:
+        """Test that HOCR output starts with XML declaration, XHTML DOCTYPE and namespace."""
+        header = processed_jpg[:HEADER_LEN]
+        assert HEADER_RE.match(header), f"Unexpected HOCR header: {header[:200]}"
 
-    def test_hocr_has_doctype(self, engine: OcrmacEngine, sample_jpg: Path) -> None:
-        """Test that HOCR output has DOCTYPE."""
-        result = engine.process(sample_jpg)
-        assert "<!DOCTYPE html" in result
-        assert "XHTML 1.0 Transitional" in result
-
-    def test_hocr_has_namespace(self, engine: OcrmacEngine, sample_jpg: Path) -> None:
-        """Test that HOCR output has XHTML namespace."""
-        result = engine.process(sample_jpg)
-        assert 'xmlns="http://www.w3.org/1999/xhtml"' in result
-
-    def test_hocr_word_bboxes_are_valid(self, engine: OcrmacEngine, sample_jpg: Path) -> None:
+    def test_hocr_word_bboxes_are_valid(self, jpg_word_errors: dict[str, list[str]]) -> None:
         """Test that all word bboxes are valid (x_min < x_max, y_min < y_max)."""
-        result = engine.process(sample_jpg)
-        root = ET.fromstring(result)
-
-        words = root.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
-
-        for word in words:
-            title = word.attrib.get("title", "")
-            # Extract bbox
-            bbox_part = [p for p in title.split(";") if p.strip().startswith("bbox")]
-            assert len(bbox_part) > 0, f"No bbox found in word title: {title}"
+        assert not jpg_word_errors["bbox"], "\n".join(jpg_word_errors["bbox"])
 
-            coords = bbox_part[0].strip()[5:].split()
-            x_min, y_min, x_max, y_max = map(int, coords)
-
-            assert x_min < x_max, f"Invalid bbox: x_min ({x_min}) >= x_max ({x_max})"
-            assert y_min < y_max, f"Invalid bbox: y_min ({y_min}) >= y_max ({y_max})"
-            assert x_min >= 0, f"Invalid bbox: x_min ({x_min}) < 0"
-            assert y_min >= 0, f"Invalid bbox: y_min ({y_min}) < 0"
-
-    def test_hocr_confidence_in_range(self, engine: OcrmacEngine, sample_jpg: Path) -> None:
+    def test_hocr_confidence_in_range(self, jpg_word_errors: dict[str, list[str]]) -> None:
         """Test that all confidence values are in range 0-100."""
-        result = engine.process(sample_jpg)
-        root = ET.fromstring(result)
-
-        words = root.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
-
-        for word in words:
-            title = word.attrib.get("title", "")
-            # Extract confidence
-            conf_part = [p for p in title.split(";") if p.strip().startswith("x_wconf")]
+        assert not jpg_word_errors["confidence"], "\n".join(jpg_word_errors["confidence"])
 
-            if conf_part:
-                conf_str = conf_part[0].strip()[8:]
-                confidence = int(conf_str)
-                assert 0 <= confidence <= 100, f"Confidence out of range: {confidence}"
-
-    def test_hocr_words_have_text(self, engine: OcrmacEngine, sample_jpg: Path) -> None:
+    def test_hocr_words_have_text(self, jpg_word_errors: dict[str, list[str]]) -> None:
         """Test that all word elements have non-empty text."""
-        result = engine.process(sample_jpg)
-        root = ET.fromstring(result)
-
-        words = root.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
-
-        for word in words:
-            text = word.text
-            assert text is not None, "Word element has None text"
-            assert len(text.strip()) > 0, "Word element has empty text"
+        assert not jpg_word_errors["text"], "\n".join(jpg_word_errors["text"])
 
     def test_hocr_page_bbox_matches_image_size(
-        self, engine: OcrmacEngine, sample_jpg: Path
+        self,
+        processed_jpg_root: ET.Element,
+        sample_jpg_size: tuple[int, int],
+        bbox_parser: Callable[[str], dict[str, Any]],
     ) -> None:
         """Test that page bbox matches actual image dimensions."""
-        from PIL import Image
+        img_width, img_height = sample_jpg_size
 
-        # Get actual image dimensions
-        with Image.open(sample_jpg) as img:
-            img_width, img_height = img.size
+        # Check the processed HOCR
+        root = processed_jpg_root
 
-        # Process and check HOCR
-        result = engine.process(sample_jpg)
-        root = ET.fromstring(result)
-
-        page = root.find(".//{http://www.w3.org/1999/xhtml}div[@class='ocr_page']")
+        page = root.find(PAGE_XPATH, NS)
         assert page is not None
 
-        title = page.attrib.get("title", "")
-        bbox_part = [p for p in title.split(";") if p.strip().startswith("bbox")]
-        assert len(bbox_part) > 0
-
-        coords = bbox_part[0].strip()[5:].split()
-        x_min, y_min, x_max, y_max = map(int, coords)
+        title = page.get("title")
+        assert title is not None
+        bbox = bbox_parser(title).get("bbox")
+        assert bbox is not None
 
-        assert x_min == 0, "Page bbox x_min should be 0"
-        assert y_min == 0, "Page bbox y_min should be 0"
-        assert x_max == img_width, f"Page bbox x_max ({x_max}) != image width ({img_width})"
-        assert y_max == img_height, f"Page bbox y_max ({y_max}) != image height ({img_height})"
+        assert bbox["x_min"] == 0, "Page bbox x_min should be 0"
+        assert bbox["y_min"] == 0, "Page bbox y_min should be 0"
+        assert bbox["x_max"] == img_width, (
+            f"Page bbox x_max ({bbox['x_max']}) != image width ({img_width})"
+        )
+        assert bbox["y_max"] == img_height, (
+            f"Page bbox y_max ({bbox['y_max']}) != image height ({img_height})"
+        )
 
     def test_pdf_hocr_is_valid_for_pdfocr(
-        self, engine: OcrmacEngine, sample_pdf_en: Path, tmp_path: Path
+        self, processed_pdf_en: str, sample_pdf_en: Path, tmp_path: Path
     ) -> None:
         """Test that generated PDF hOCR is accepted by pdfocr."""
         pdfocr_path = shutil.which("pdfocr")
         if pdfocr_path is None:
             pytest.skip("pdfocr is not installed")
 
-        hocr = engine.process(sample_pdf_en)
+        hocr = processed_pdf_en
 
         hocr_path = tmp_path / "output.hocr"
         output_pdf = tmp_path / "output.pdf"
@@ -409,12 +423,11 @@ class TestEndToEnd:
         root = hocr_validator(result)
 
         # Verify we got results
-        words = root.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
-        assert len(words) > 0
+        assert root.find(WORD_XPATH, NS) is not None
 
         # Verify XML is well-formed
-        assert "<?xml" in result
-        assert "</html>" in result
+        assert result.startswith("<?xml")
+        assert result.endswith("</html>")
 
     def test_complete_workflow_pdf(
         self,
@@ -431,27 +444,19 @@ class TestEndToEnd:
         root = hocr_validator(result)
 
         # Verify we got results
-        words = root.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
-        assert len(words) > 0
+        assert root.find(WORD_XPATH, NS) is not None
 
         # Verify pages
-        pages = root.findall(".//{http://www.w3.org/1999/xhtml}div[@class='ocr_page']")
-        assert len(pages) >= 1
+        assert root.find(PAGE_XPATH, NS) is not None
 
     def test_default_params_workflow(
         self,
-        engine: OcrmacEngine,
-        sample_jpg: Path,
-        hocr_validator: Callable[[str], ET.Element],
+        processed_jpg_root: ET.Element,
     ) -> None:
         """Test workflow with default parameters."""
-        # Process with no params (should use defaults)
-        result = engine.process(sample_jpg)
-
-        # Should still work
-        root = hocr_validator(result)
-        words = root.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
-        assert len(words) > 0
+        # Processed with no params (should use defaults) and validated
+        root = processed_jpg_root
+        assert root.find(WORD_XPATH, NS) is not None
 
     def test_multiple_files_workflow(
         self,
@@ -460,18 +465,13 @@ class TestEndToEnd:
         sample_jpg_2: Path,
         hocr_validator: Callable[[str], ET.Element],
     ) -> None:
-        """Test processing multiple files in sequence."""
-        # Process first file
-        result1 = engine.process(sample_jpg)
-        root1 = hocr_validator(result1)
-        words1 = root1.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
-        assert len(words1) > 0
+        """Test processing multiple files in one process_many batch."""
+        result1, result2 = engine.process_many([sample_jpg, sample_jpg_2])
 
-        # Process second file
-        result2 = engine.process(sample_jpg_2)
+        root1 = hocr_validator(result1)
+        assert root1.find(WORD_XPATH, NS) is not None
         root2 = hocr_validator(result2)
-        words2 = root2.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
-        assert len(words2) > 0
+        assert root2.find(WORD_XPATH, NS) is not None
 
         # Results should be different
         assert result1 != result2
@@ -1,29 +1,77 @@
 """Unit tests for ocrmac engine (mocked, runs on any platform)."""
 
-import tempfile
+import gc
+import platform
+import threading
+import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, Iterator
 from unittest.mock import Mock, patch
 
+import pypdfium2 as pdfium
 import pytest
 from ocrbridge.core import OCRProcessingError, UnsupportedFormatError
 from PIL import Image
 
 from ocrbridge.engines.ocrmac import OcrmacEngine, OcrmacParams, RecognitionLevel
+from ocrbridge.engines.ocrmac import engine as engine_module
+from ocrbridge.engines.ocrmac.engine import _load_ocrmac, _ocr_kwargs
+
+XHTML = "{http://www.w3.org/1999/xhtml}"
+BODY_XPATH = f"{XHTML}body"
+PAGE_XPATH = f".//{XHTML}div[@class='ocr_page']"
+LINE_XPATH = f".//{XHTML}span[@class='ocr_line']"
+WORD_XPATH = f".//{XHTML}span[@class='ocrx_word']"
+
+
+def _recorder(result: str) -> tuple[list[tuple[Any, ...]], Callable[..., str]]:
+    """Return a call list and a stub that records its arguments and returns result."""
+    calls: list[tuple[Any, ...]] = []
+
+    def stub(*args: Any) -> str:
+        calls.append(args)
+        return result
+
+    return calls, stub
+
+
+@pytest.fixture(scope="module")
+def sample_files(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """Return one empty file per supported extension, created once for the module."""
+    directory = tmp_path_factory.mktemp("formats")
+    files: dict[str, Path] = {}
+    for ext in (".jpg", ".jpeg", ".png", ".pdf", ".tiff", ".tif"):
+        files[ext] = directory / f"sample{ext}"
+        files[ext].touch()
+    return files
+
+
+@pytest.fixture
+def converted(
+    engine: OcrmacEngine, default_params: OcrmacParams
+) -> Callable[..., tuple[str, ET.Element]]:
+    """Return a function converting annotations on a 1000x800 page to HOCR and its root."""
+
+    def convert(
+        annotations: Iterable[Any], width: int = 1000, height: int = 800
+    ) -> tuple[str, ET.Element]:
+        hocr = engine._convert_to_hocr(annotations, width, height, default_params)
+        return hocr, ET.fromstring(hocr)
+
+    return convert
 
 
 class TestEngineProperties:
     """Tests for engine properties."""
 
-    def test_engine_name(self) -> None:
+    def test_engine_name(self, engine: OcrmacEngine) -> None:
         """Test engine name property."""
-        engine = OcrmacEngine()
         assert engine.name == "ocrmac"
 
-    def test_supported_formats(self) -> None:
+    def test_supported_formats(self, engine: OcrmacEngine) -> None:
         """Test supported formats property."""
-        engine = OcrmacEngine()
         formats = engine.supported_formats
 
         assert ".jpg" in formats
@@ -34,119 +82,84 @@ class TestEngineProperties:
         assert ".tif" in formats
         assert len(formats) == 6
 
-    def test_supported_formats_immutable(self) -> None:
+    def test_supported_formats_immutable(self, engine: OcrmacEngine) -> None:
         """Test that supported formats is a set."""
-        engine = OcrmacEngine()
         assert isinstance(engine.supported_formats, set)
 
 
 class TestPlatformValidation:
     """Tests for platform validation."""
 
-    @patch("platform.system")
-    def test_validate_platform_on_darwin(self, mock_system: Mock) -> None:
+    def test_validate_platform_on_darwin(self) -> None:
         """Test platform validation succeeds on macOS."""
-        mock_system.return_value = "Darwin"
-        engine = OcrmacEngine()
+        engine = OcrmacEngine(_platform_system=lambda: "Darwin")
         engine._validate_platform()  # Should not raise
 
-    @patch("platform.system")
-    def test_validate_platform_on_windows(self, mock_system: Mock) -> None:
-        """Test platform validation fails on Windows."""
-        mock_system.return_value = "Windows"
-        engine = OcrmacEngine()
+    @pytest.mark.parametrize("system", ["Windows", "Linux"])
+    def test_validate_platform_on_other_systems(self, system: str) -> None:
+        """Test platform validation fails outside macOS and names the platform."""
+        engine = OcrmacEngine(_platform_system=lambda: system)
 
         with pytest.raises(OCRProcessingError) as exc_info:
             engine._validate_platform()
 
         assert "only available on macOS" in str(exc_info.value)
-        assert "Windows" in str(exc_info.value)
-
-    @patch("platform.system")
-    def test_validate_platform_on_linux(self, mock_system: Mock) -> None:
-        """Test platform validation fails on Linux."""
-        mock_system.return_value = "Linux"
-        engine = OcrmacEngine()
-
-        with pytest.raises(OCRProcessingError) as exc_info:
-            engine._validate_platform()
+        assert system in str(exc_info.value)
 
-        assert "only available on macOS" in str(exc_info.value)
-        assert "Linux" in str(exc_info.value)
+    def test_platform_probed_once(self) -> None:
+        """Test that the platform is probed at construction, not on every call."""
+        mock_system = Mock(return_value="Darwin")
+        mock_mac_ver = Mock(return_value=("14.0", ("", "", ""), ""))
+        engine = OcrmacEngine(_platform_system=mock_system, _mac_ver=mock_mac_ver)
 
+        engine._validate_platform()
+        engine._validate_platform()
+        engine._validate_livetext_requirement(RecognitionLevel.LIVETEXT)
 
-class TestLiveTextValidation:
-    """Tests for LiveText version validation."""
+        assert mock_system.call_count == 1
+        assert mock_mac_ver.call_count == 1
 
-    @patch("platform.mac_ver")
-    def test_livetext_on_sonoma_14_0(self, mock_mac_ver: Mock) -> None:
-        """Test LiveText validation succeeds on macOS Sonoma 14.0."""
-        mock_mac_ver.return_value = ("14.0", ("", "", ""), "")
+    def test_probes_default_to_platform_module(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that the engine probes the platform module when no probes are given."""
+        monkeypatch.setattr(platform, "system", lambda: "Darwin")
+        monkeypatch.setattr(platform, "mac_ver", lambda: ("14.0", ("", "", ""), ""))
         engine = OcrmacEngine()
-        engine._validate_livetext_requirement(RecognitionLevel.LIVETEXT)  # Should not raise
 
-    @patch("platform.mac_ver")
-    def test_livetext_on_sonoma_14_5(self, mock_mac_ver: Mock) -> None:
-        """Test LiveText validation succeeds on macOS Sonoma 14.5."""
-        mock_mac_ver.return_value = ("14.5.1", ("", "", ""), "")
-        engine = OcrmacEngine()
-        engine._validate_livetext_requirement(RecognitionLevel.LIVETEXT)  # Should not raise
+        engine._validate_platform()
+        engine._validate_livetext_requirement(RecognitionLevel.LIVETEXT)
 
-    @patch("platform.mac_ver")
-    def test_livetext_on_sequoia_15_0(self, mock_mac_ver: Mock) -> None:
-        """Test LiveText validation succeeds on macOS Sequoia 15.0+."""
-        mock_mac_ver.return_value = ("15.0", ("", "", ""), "")
-        engine = OcrmacEngine()
-        engine._validate_livetext_requirement(RecognitionLevel.LIVETEXT)  # Should not raise
-
-    @patch("platform.mac_ver")
-    def test_livetext_on_ventura_13(self, mock_mac_ver: Mock) -> None:
-        """Test LiveText validation fails on macOS Ventura 13.x."""
-        mock_mac_ver.return_value = ("13.5", ("", "", ""), "")
-        engine = OcrmacEngine()
-
-        with pytest.raises(OCRProcessingError) as exc_info:
-            engine._validate_livetext_requirement(RecognitionLevel.LIVETEXT)
-
-        assert "requires macOS Sonoma (14.0) or later" in str(exc_info.value)
-        assert "13.5" in str(exc_info.value)
 
-    @patch("platform.mac_ver")
-    def test_livetext_on_monterey_12(self, mock_mac_ver: Mock) -> None:
-        """Test LiveText validation fails on macOS Monterey 12.x."""
-        mock_mac_ver.return_value = ("12.6", ("", "", ""), "")
-        engine = OcrmacEngine()
-
-        with pytest.raises(OCRProcessingError) as exc_info:
-            engine._validate_livetext_requirement(RecognitionLevel.LIVETEXT)
-
-        assert "requires macOS Sonoma (14.0) or later" in str(exc_info.value)
-
-    @patch("platform.mac_ver")
-    def test_livetext_no_version_available(self, mock_mac_ver: Mock) -> None:
-        """Test LiveText validation fails when version cannot be determined."""
-        mock_mac_ver.return_value = ("", ("", "", ""), "")
-        engine = OcrmacEngine()
-
-        with pytest.raises(OCRProcessingError) as exc_info:
-            engine._validate_livetext_requirement(RecognitionLevel.LIVETEXT)
+class TestLiveTextValidation:
+    """Tests for LiveText version validation."""
 
-        assert "Unable to determine macOS version" in str(exc_info.value)
+    @pytest.mark.parametrize("version", ["14.0", "14.5.1", "15.0"])
+    def test_livetext_on_supported_versions(self, version: str) -> None:
+        """Test LiveText validation succeeds on macOS Sonoma 14.0 and later."""
+        engine = OcrmacEngine(_mac_ver=lambda: (version, ("", "", ""), ""))
+        engine._validate_livetext_requirement(RecognitionLevel.LIVETEXT)  # Should not raise
 
-    @patch("platform.mac_ver")
-    def test_livetext_invalid_version_format(self, mock_mac_ver: Mock) -> None:
-        """Test LiveText validation fails with invalid version format."""
-        mock_mac_ver.return_value = ("invalid", ("", "", ""), "")
-        engine = OcrmacEngine()
+    @pytest.mark.parametrize(
+        ("version", "message"),
+        [
+            ("13.5", "requires macOS Sonoma (14.0) or later"),
+            ("12.6", "requires macOS Sonoma (14.0) or later"),
+            ("", "Unable to determine macOS version"),
+            ("invalid", "Invalid macOS version format"),
+        ],
+        ids=["ventura", "monterey", "no-version", "invalid-version"],
+    )
+    def test_livetext_on_unsupported_versions(self, version: str, message: str) -> None:
+        """Test LiveText validation fails before Sonoma or without a usable version."""
+        engine = OcrmacEngine(_mac_ver=lambda: (version, ("", "", ""), ""))
 
         with pytest.raises(OCRProcessingError) as exc_info:
             engine._validate_livetext_requirement(RecognitionLevel.LIVETEXT)
 
-        assert "Invalid macOS version format" in str(exc_info.value)
+        assert message in str(exc_info.value)
+        assert version in str(exc_info.value)
 
-    def test_non_livetext_levels_skip_validation(self) -> None:
+    def test_non_livetext_levels_skip_validation(self, engine: OcrmacEngine) -> None:
         """Test that non-LiveText recognition levels skip validation."""
-        engine = OcrmacEngine()
         # These should not raise even if platform.mac_ver() returns bad data
         engine._validate_livetext_requirement(RecognitionLevel.FAST)
         engine._validate_livetext_requirement(RecognitionLevel.BALANCED)
@@ -156,56 +169,39 @@ class TestLiveTextValidation:
 class TestFileValidation:
     """Tests for file validation."""
 
-    @patch("platform.system", return_value="Darwin")
-    def test_file_not_found(self, mock_system: Mock) -> None:
+    def test_file_not_found(self, tmp_path: Path) -> None:
         """Test that missing file raises error."""
-        engine = OcrmacEngine()
-        non_existent = Path("/tmp/does_not_exist_12345.jpg")
+        engine = OcrmacEngine(_platform_system=lambda: "Darwin")
+        non_existent = tmp_path / "does_not_exist.jpg"
 
         with pytest.raises(OCRProcessingError) as exc_info:
             engine.process(non_existent)
 
         assert "File not found" in str(exc_info.value)
 
-    @patch("platform.system", return_value="Darwin")
-    def test_unsupported_format(self, mock_system: Mock) -> None:
+    def test_unsupported_format(self, tmp_path: Path) -> None:
         """Test that unsupported format raises error."""
-        engine = OcrmacEngine()
+        engine = OcrmacEngine(_platform_system=lambda: "Darwin")
+        text_file = tmp_path / "sample.txt"
+        text_file.touch()
 
-        # Create a temporary file with unsupported extension
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as tmp:
-            tmp_path = Path(tmp.name)
+        with pytest.raises(UnsupportedFormatError) as exc_info:
+            engine.process(text_file)
 
-        try:
-            with pytest.raises(UnsupportedFormatError) as exc_info:
-                engine.process(tmp_path)
-
-            assert "Unsupported file format: .txt" in str(exc_info.value)
-            assert ".jpg" in str(exc_info.value)
-            assert ".pdf" in str(exc_info.value)
-        finally:
-            tmp_path.unlink(missing_ok=True)
+        assert "Unsupported file format: .txt" in str(exc_info.value)
+        assert ".jpg" in str(exc_info.value)
+        assert ".pdf" in str(exc_info.value)
 
-    @patch("platform.system", return_value="Darwin")
-    def test_supported_formats_accepted(self, mock_system: Mock) -> None:
+    def test_supported_formats_accepted(self, sample_files: dict[str, Path]) -> None:
         """Test that all supported formats are accepted during validation."""
-        engine = OcrmacEngine()
-        supported = [".jpg", ".jpeg", ".png", ".pdf", ".tiff", ".tif"]
+        engine = OcrmacEngine(_platform_system=lambda: "Darwin")
+        image_calls, engine._process_image = _recorder("<hocr></hocr>")
+        pdf_calls, engine._process_pdf = _recorder("<hocr></hocr>")
 
-        for ext in supported:
-            with tempfile.NamedTemporaryFile(suffix=ext, delete=False) as tmp:
-                tmp_path = Path(tmp.name)
+        for path in sample_files.values():
+            engine.process(path)
 
-            try:
-                # File exists and format is valid, but will fail later in processing
-                # (that's ok, we're just testing format validation here)
-                with patch.object(engine, "_process_image"), patch.object(engine, "_process_pdf"):
-                    try:
-                        engine.process(tmp_path)
-                    except Exception:
-                        pass  # Expected since file is empty
-            finally:
-                tmp_path.unlink(missing_ok=True)
+        assert len(image_calls) + len(pdf_calls) == len(sample_files)
 
 
 class TestHOCRConversion:
@@ -213,41 +209,37 @@ class TestHOCRConversion:
 
     def test_convert_to_hocr_basic(
         self,
+        engine: OcrmacEngine,
+        default_params: OcrmacParams,
         mock_ocrmac_annotations: list[tuple[str, float, tuple[float, float, float, float]]],
         hocr_validator: Callable[[str], ET.Element],
     ) -> None:
         """Test basic HOCR conversion."""
-        engine = OcrmacEngine()
-        params = OcrmacParams()
-
-        hocr = engine._convert_to_hocr(mock_ocrmac_annotations, 1000, 800, params)
+        hocr = engine._convert_to_hocr(mock_ocrmac_annotations, 1000, 800, default_params)
 
         # Validate structure
         root = hocr_validator(hocr)
 
         # Check body contains page
-        body = root.find("{http://www.w3.org/1999/xhtml}body")
+        body = root.find(BODY_XPATH)
         assert body is not None
 
-        page = body.find(".//{http://www.w3.org/1999/xhtml}div[@class='ocr_page']")
+        page = body.find(PAGE_XPATH)
         assert page is not None
         assert page.attrib.get("id") == "page_1"
         assert "bbox 0 0 1000 800" in page.attrib.get("title", "")
 
     def test_convert_to_hocr_words(
         self,
+        converted: Callable[..., tuple[str, ET.Element]],
         mock_ocrmac_annotations: list[tuple[str, float, tuple[float, float, float, float]]],
         bbox_parser: Callable[[str], dict[str, Any]],
     ) -> None:
         """Test HOCR word elements."""
-        engine = OcrmacEngine()
-        params = OcrmacParams()
-
-        hocr = engine._convert_to_hocr(mock_ocrmac_annotations, 1000, 800, params)
-        root = ET.fromstring(hocr)
+        _, root = converted(mock_ocrmac_annotations)
 
         # Find all word elements
-        words = root.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
+        words = root.findall(WORD_XPATH)
         assert len(words) == 3
 
         # Check first word
@@ -262,45 +254,38 @@ class TestHOCRConversion:
         assert words[2].text == "Test"
         assert words[2].attrib.get("id") == "word_1_3"
 
-    def test_convert_to_hocr_lines(self) -> None:
+    def test_convert_to_hocr_lines(self, converted: Callable[..., tuple[str, ET.Element]]) -> None:
         """Test HOCR line container elements."""
-        engine = OcrmacEngine()
-        params = OcrmacParams()
-
         annotations = [
             ("Hello", 0.95, (0.1, 0.8, 0.15, 0.1)),
             ("World", 0.90, (0.3, 0.8, 0.15, 0.1)),
             ("Test", 0.85, (0.1, 0.5, 0.1, 0.08)),
         ]
 
-        hocr = engine._convert_to_hocr(annotations, 1000, 800, params)
-        root = ET.fromstring(hocr)
+        _, root = converted(annotations)
 
-        lines = root.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocr_line']")
+        lines = root.findall(LINE_XPATH)
         assert len(lines) == 2
 
-        first_line_words = lines[0].findall(
-            "{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']"
-        )
+        first_line_words = lines[0].findall(WORD_XPATH)
         assert [word.text for word in first_line_words] == ["Hello", "World"]
 
-        second_line_words = lines[1].findall(
-            "{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']"
-        )
+        second_line_words = lines[1].findall(WORD_XPATH)
         assert [word.text for word in second_line_words] == ["Test"]
 
         assert "bbox 100 79 449 159" in lines[0].attrib.get("title", "")
         assert "bbox 100 336 200 400" in lines[1].attrib.get("title", "")
 
-    def test_coordinate_transformation(self, bbox_parser: Callable[[str], dict[str, Any]]) -> None:
+    def test_coordinate_transformation(
+        self,
+        converted: Callable[..., tuple[str, ET.Element]],
+        bbox_parser: Callable[[str], dict[str, Any]],
+    ) -> None:
         """Test coordinate transformation from ocrmac to HOCR format.
 
         ocrmac: relative coords (0.0-1.0), bottom-left origin
         HOCR: absolute pixels, top-left origin
         """
-        engine = OcrmacEngine()
-        params = OcrmacParams()
-
         # Test annotation at bottom-left corner
         # ocrmac: x=0.1, y=0.1 (from bottom), width=0.2, height=0.1
         # For 1000x800 image:
@@ -310,10 +295,9 @@ class TestHOCRConversion:
         # - y_max (from top): (1.0 - 0.1) * 800 = 0.9 * 800 = 720
         annotations = [("Bottom", 0.95, (0.1, 0.1, 0.2, 0.1))]
 
-        hocr = engine._convert_to_hocr(annotations, 1000, 800, params)
-        root = ET.fromstring(hocr)
+        _, root = converted(annotations)
 
-        word = root.find(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
+        word = root.find(WORD_XPATH)
         assert word is not None
 
         title = word.attrib.get("title", "")
@@ -324,21 +308,40 @@ class TestHOCRConversion:
         assert bbox["bbox"]["y_min"] == 640
         assert bbox["bbox"]["y_max"] == 720
 
-    def test_confidence_conversion(self, bbox_parser: Callable[[str], dict[str, Any]]) -> None:
-        """Test confidence conversion from 0-1 to 0-100."""
-        engine = OcrmacEngine()
-        params = OcrmacParams()
+    def test_overhanging_word_bbox(
+        self,
+        converted: Callable[..., tuple[str, ET.Element]],
+        bbox_parser: Callable[[str], dict[str, Any]],
+    ) -> None:
+        """Test that a word overhanging the top-left corner keeps negative coordinates."""
+        annotations = [("Edge", 0.90, (-0.05, 0.95, 0.1, 0.1))]
+
+        _, root = converted(annotations)
 
+        word = root.find(WORD_XPATH)
+        assert word is not None
+        parsed = bbox_parser(word.attrib.get("title", ""))
+
+        assert parsed["bbox"]["x_min"] == -50
+        assert parsed["bbox"]["y_min"] < 0
+        assert parsed["bbox"]["x_max"] == 50
+        assert parsed["confidence"] == 90
+
+    def test_confidence_conversion(
+        self,
+        converted: Callable[..., tuple[str, ET.Element]],
+        bbox_parser: Callable[[str], dict[str, Any]],
+    ) -> None:
+        """Test confidence conversion from 0-1 to 0-100."""
         annotations = [
             ("High", 0.95, (0.1, 0.1, 0.2, 0.1)),
             ("Medium", 0.75, (0.3, 0.1, 0.2, 0.1)),
             ("Low", 0.50, (0.5, 0.1, 0.2, 0.1)),
         ]
 
-        hocr = engine._convert_to_hocr(annotations, 1000, 800, params)
-        root = ET.fromstring(hocr)
+        _, root = converted(annotations)
 
-        words = root.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
+        words = root.findall(WORD_XPATH)
 
         title1 = words[0].attrib.get("title", "")
         assert "x_wconf 95" in title1
@@ -349,189 +352,621 @@ class TestHOCRConversion:
         title3 = words[2].attrib.get("title", "")
         assert "x_wconf 50" in title3
 
-    def test_empty_annotations(self, hocr_validator: Callable[[str], ET.Element]) -> None:
-        """Test HOCR conversion with empty annotations."""
-        engine = OcrmacEngine()
-        params = OcrmacParams()
+    def test_special_characters_escaped(
+        self, converted: Callable[..., tuple[str, ET.Element]]
+    ) -> None:
+        """Test that markup characters in recognized text are escaped."""
+        annotations = [("<b>&", 0.9, (0.1, 0.1, 0.2, 0.1)), ('"quoted"', 0.9, (0.4, 0.1, 0.2, 0.1))]
 
-        hocr = engine._convert_to_hocr([], 1000, 800, params)
+        hocr, root = converted(annotations)
+
+        words = root.findall(WORD_XPATH)
+        assert [word.text for word in words] == ["<b>&", '"quoted"']
+        assert "&lt;b&gt;&amp;" in hocr
+        assert "&quot;quoted&quot;" in hocr
+
+    def test_annotations_from_iterator(
+        self, engine: OcrmacEngine, default_params: OcrmacParams
+    ) -> None:
+        """Test that annotations can be streamed instead of passed as a list."""
+        annotations = [
+            ("Hello", 0.95, (0.1, 0.8, 0.2, 0.05)),
+            ("World", 0.9, (0.35, 0.8, 0.2, 0.05)),
+        ]
+
+        hocr = engine._convert_to_hocr(iter(annotations), 1000, 800, default_params)
+
+        assert hocr == engine._convert_to_hocr(annotations, 1000, 800, default_params)
+        assert "Hello" in hocr and "World" in hocr
+
+    def test_empty_annotations(
+        self,
+        engine: OcrmacEngine,
+        default_params: OcrmacParams,
+        hocr_validator: Callable[[str], ET.Element],
+    ) -> None:
+        """Test HOCR conversion with empty annotations."""
+        hocr = engine._convert_to_hocr([], 1000, 800, default_params)
 
         # Should still have valid structure
         root = hocr_validator(hocr)
-        body = root.find("{http://www.w3.org/1999/xhtml}body")
+        body = root.find(BODY_XPATH)
         assert body is not None
 
         # No word elements
-        words = root.findall(".//{http://www.w3.org/1999/xhtml}span[@class='ocrx_word']")
+        words = root.findall(WORD_XPATH)
         assert len(words) == 0
 
 
 class TestHOCRPageMerging:
     """Tests for HOCR page merging."""
 
-    def test_merge_single_page(self, hocr_validator: Callable[[str], ET.Element]) -> None:
-        """Test merging single page returns original."""
-        engine = OcrmacEngine()
+    def test_wrap_single_page(
+        self,
+        engine: OcrmacEngine,
+        default_params: OcrmacParams,
+        hocr_validator: Callable[[str], ET.Element],
+    ) -> None:
+        """Test that wrapping one page div matches the single-page conversion."""
+        page_div = engine._convert_to_hocr_page_div([], 1000, 800, 1)
+        result = engine._wrap_hocr([page_div])
 
-        page_hocr = """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-<meta http-equiv="content-type" content="text/html; charset=utf-8" />
-<meta name="ocr-system" content="ocrmac" />
-</head>
-<body><div class="ocr_page">Page 1</div></body>
-</html>"""
-
-        result = engine._merge_hocr_pages([page_hocr])
-        assert result == page_hocr
-
-    def test_merge_multiple_pages(self, hocr_validator: Callable[[str], ET.Element]) -> None:
-        """Test merging multiple pages."""
-        engine = OcrmacEngine()
+        hocr_validator(result)
+        assert result == engine._convert_to_hocr([], 1000, 800, default_params)
 
-        page1 = """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-<meta http-equiv="content-type" content="text/html; charset=utf-8" />
-<meta name="ocr-system" content="ocrmac" />
-</head>
-<body><div class="ocr_page" id="page_1">Page 1</div></body>
-</html>"""
-
-        page2 = """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-<meta http-equiv="content-type" content="text/html; charset=utf-8" />
-<meta name="ocr-system" content="ocrmac" />
-</head>
-<body><div class="ocr_page" id="page_2">Page 2</div></body>
-</html>"""
-
-        result = engine._merge_hocr_pages([page1, page2])
+    def test_wrap_multiple_pages(
+        self,
+        engine: OcrmacEngine,
+        hocr_validator: Callable[[str], ET.Element],
+        mock_ocrmac_annotations: list[tuple[str, float, tuple[float, float, float, float]]],
+    ) -> None:
+        """Test that page divs are wrapped in order with page-scoped ids."""
+        page_divs = [
+            engine._convert_to_hocr_page_div(mock_ocrmac_annotations, 1000, 800, page_number)
+            for page_number in (1, 2)
+        ]
+        result = engine._wrap_hocr(page_divs)
 
-        # Validate structure
         root = hocr_validator(result)
-        body = root.find("{http://www.w3.org/1999/xhtml}body")
-        assert body is not None
+        pages = root.findall(PAGE_XPATH)
+        assert [page.attrib.get("id") for page in pages] == ["page_1", "page_2"]
 
-        # Check both pages are present
-        body_text = ET.tostring(body, encoding="unicode")
-        assert "Page 1" in body_text
-        assert "Page 2" in body_text
-
-    def test_merge_empty_pages(self, hocr_validator: Callable[[str], ET.Element]) -> None:
-        """Test merging with empty pages."""
-        engine = OcrmacEngine()
+        second_page_words = pages[1].findall(f".//{XHTML}span")
+        word_ids = [word.attrib.get("id", "") for word in second_page_words]
+        assert all(word_id.split("_")[1] == "2" for word_id in word_ids)
 
-        page1 = """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-<meta http-equiv="content-type" content="text/html; charset=utf-8" />
-<meta name="ocr-system" content="ocrmac" />
-</head>
-<body></body>
-</html>"""
-
-        page2 = """<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE html PUBLIC "-//W3C//DTD XHTML 1.0 Transitional//EN" "http://www.w3.org/TR/xhtml1/DTD/xhtml1-transitional.dtd">
-<html xmlns="http://www.w3.org/1999/xhtml">
-<head>
-<meta http-equiv="content-type" content="text/html; charset=utf-8" />
-<meta name="ocr-system" content="ocrmac" />
-</head>
-<body></body>
-</html>"""
-
-        result = engine._merge_hocr_pages([page1, page2])
+    def test_wrap_empty_pages(
+        self, engine: OcrmacEngine, hocr_validator: Callable[[str], ET.Element]
+    ) -> None:
+        """Test wrapping pages without any recognized text."""
+        page_divs = [engine._convert_to_hocr_page_div([], 1000, 800, n) for n in (1, 2)]
+        result = engine._wrap_hocr(page_divs)
 
         # Should have valid structure
-        hocr_validator(result)
+        root = hocr_validator(result)
+        words = root.findall(WORD_XPATH)
+        assert len(words) == 0
 
 
 class TestProcessMethod:
     """Tests for main process method."""
 
-    @patch("platform.system", return_value="Windows")
-    def test_process_fails_on_non_darwin(self, mock_system: Mock) -> None:
+    def test_process_fails_on_non_darwin(self, tmp_path: Path) -> None:
         """Test that process fails on non-Darwin platforms."""
+        engine = OcrmacEngine(_platform_system=lambda: "Windows")
+        image_path = tmp_path / "sample.jpg"
+        image_path.touch()
+
+        with pytest.raises(OCRProcessingError) as exc_info:
+            engine.process(image_path)
+
+        assert "only available on macOS" in str(exc_info.value)
+
+    def test_process_uses_default_params(self, tmp_path: Path) -> None:
+        """Test that process uses default params when none provided."""
+        engine = OcrmacEngine(_platform_system=lambda: "Darwin")
+        # The image handler is stubbed, so an empty file is enough to route
+        image_path = tmp_path / "sample.jpg"
+        image_path.touch()
+        calls, engine._process_image = _recorder("<hocr></hocr>")
+
+        engine.process(image_path)
+
+        assert calls == [(image_path, OcrmacParams())]
+
+    def test_process_validates_livetext(self, tmp_path: Path) -> None:
+        """Test that process validates LiveText requirements."""
+        engine = OcrmacEngine(
+            _platform_system=lambda: "Darwin", _mac_ver=lambda: ("13.0", ("", "", ""), "")
+        )
+        params = OcrmacParams(recognition_level=RecognitionLevel.LIVETEXT)
+        image_path = tmp_path / "sample.jpg"
+        image_path.touch()
+
+        with pytest.raises(OCRProcessingError) as exc_info:
+            engine.process(image_path, params)
+
+        assert "LiveText requires macOS Sonoma" in str(exc_info.value)
+
+    def test_process_routes_to_pdf_handler(self, tmp_path: Path) -> None:
+        """Test that PDF files are routed to _process_pdf."""
+        engine = OcrmacEngine(_platform_system=lambda: "Darwin")
+
+        file_path = tmp_path / "sample.pdf"
+        file_path.touch()
+        calls, engine._process_pdf = _recorder("<hocr></hocr>")
+
+        assert engine.process(file_path) == "<hocr></hocr>"
+        assert len(calls) == 1
+
+    def test_process_routes_to_image_handler(self, tmp_path: Path) -> None:
+        """Test that image files are routed to _process_image."""
+        engine = OcrmacEngine(_platform_system=lambda: "Darwin")
+
+        file_path = tmp_path / "sample.jpg"
+        file_path.touch()
+        calls, engine._process_image = _recorder("<hocr></hocr>")
+
+        assert engine.process(file_path) == "<hocr></hocr>"
+        assert len(calls) == 1
+
+
+class TestImageProcessing:
+    """Tests for image processing."""
+
+    def test_image_opened_once_and_passed_to_ocrmac(
+        self, engine: OcrmacEngine, mock_ocrmac_module: Mock, tmp_path: Path
+    ) -> None:
+        """Test that the opened PIL image is handed to ocrmac and sizes the page."""
+        image_path = tmp_path / "sample.png"
+        Image.new("RGB", (120, 80), color="white").save(image_path)
+
+        with patch("ocrbridge.engines.ocrmac.engine._load_ocrmac", return_value=mock_ocrmac_module):
+            result = engine._process_image(image_path, OcrmacParams())
+
+        ocr_input = mock_ocrmac_module.OCR.call_args.args[0]
+        assert isinstance(ocr_input, Image.Image)
+        assert ocr_input.size == (120, 80)
+        assert 'title="bbox 0 0 120 80"' in result
+
+
+class TestOcrKwargs:
+    """Tests for ocrmac.OCR keyword argument selection."""
+
+    def test_balanced_uses_ocrmac_defaults(self) -> None:
+        """Test that balanced passes only the language preference."""
+        params = OcrmacParams(languages=["en-US"])
+
+        assert _ocr_kwargs(params) == {"language_preference": ["en-US"]}
+
+    @pytest.mark.parametrize("level", [RecognitionLevel.FAST, RecognitionLevel.ACCURATE])
+    def test_fast_and_accurate_set_recognition_level(self, level: RecognitionLevel) -> None:
+        """Test that fast and accurate pass their Vision recognition level."""
+        params = OcrmacParams(recognition_level=level)
+
+        assert _ocr_kwargs(params) == {
+            "language_preference": None,
+            "recognition_level": level.value,
+        }
+
+    def test_livetext_selects_framework(self) -> None:
+        """Test that livetext switches the framework instead of the level."""
+        params = OcrmacParams(recognition_level=RecognitionLevel.LIVETEXT)
+
+        assert _ocr_kwargs(params) == {"language_preference": None, "framework": "livetext"}
+
+
+class TestPDFProcessing:
+    """Tests for PDF page processing."""
+
+    def test_pdf_pages_keep_order(self, mock_ocrmac_module: Mock) -> None:
+        """Test that concurrently processed pages are merged in page order."""
+        engine = OcrmacEngine()
+        params = OcrmacParams(concurrency=3)
+        images = [Image.new("RGB", (100 + i, 200 + i), color="white") for i in range(3)]
+
+        with (
+            patch.object(engine, "_render_pdf_pages", return_value=(image for image in images)),
+            patch("ocrbridge.engines.ocrmac.engine._load_ocrmac", return_value=mock_ocrmac_module),
+        ):
+            result = engine._process_pdf(Path("document.pdf"), params)
+
+        root = ET.fromstring(result)
+        pages = root.findall(PAGE_XPATH)
+        assert [page.attrib.get("title") for page in pages] == [
+            "bbox 0 0 100 200",
+            "bbox 0 0 101 201",
+            "bbox 0 0 102 202",
+        ]
+        assert [page.attrib.get("id") for page in pages] == ["page_1", "page_2", "page_3"]
+        ocr_inputs = [call.args[0] for call in mock_ocrmac_module.OCR.call_args_list]
+        assert sorted(image.size for image in ocr_inputs) == [(100, 200), (101, 201), (102, 202)]
+
+    def test_pdf_single_page(self, mock_ocrmac_module: Mock) -> None:
+        """Test that a single-page PDF matches the single-image HOCR."""
+        engine = OcrmacEngine()
+        params = OcrmacParams()
+        images = [Image.new("RGB", (100, 200), color="white")]
+
+        with (
+            patch.object(engine, "_render_pdf_pages", return_value=(image for image in images)),
+            patch("ocrbridge.engines.ocrmac.engine._load_ocrmac", return_value=mock_ocrmac_module),
+        ):
+            result = engine._process_pdf(Path("document.pdf"), params)
+
+        assert result == engine._convert_to_hocr([], 100, 200, params)
+
+    def test_render_pdf_pages(self, engine: OcrmacEngine, sample_pdf_en: Path) -> None:
+        """Test that PDF pages are rendered in-process at the requested DPI."""
+        images = list(engine._render_pdf_pages(sample_pdf_en, 300))
+
+        assert len(images) == 2
+        for image in images:
+            assert image.mode == "RGB"
+            # A4/Letter pages at 300 DPI are roughly 2480x3508 pixels
+            assert 2300 < image.width < 2700
+            assert 3300 < image.height < 3600
+
+    def test_pdf_rendered_at_params_dpi(self, mock_ocrmac_module: Mock) -> None:
+        """Test that the dpi parameter is passed through to page rendering."""
         engine = OcrmacEngine()
+        images = [Image.new("RGB", (100, 200), color="white")]
 
-        with tempfile.NamedTemporaryFile(suffix=".jpg") as tmp:
-            tmp_path = Path(tmp.name)
+        with (
+            patch.object(
+                engine, "_render_pdf_pages", return_value=(image for image in images)
+            ) as render,
+            patch("ocrbridge.engines.ocrmac.engine._load_ocrmac", return_value=mock_ocrmac_module),
+        ):
+            engine._process_pdf(Path("document.pdf"), OcrmacParams(dpi=150))
+
+        render.assert_called_once_with(Path("document.pdf"), 150)
+
+    def test_pdf_conversion_failure(
+        self, engine: OcrmacEngine, mock_ocrmac_module: Mock, tmp_path: Path
+    ) -> None:
+        """Test that rasterization errors are wrapped in OCRProcessingError."""
+        broken_pdf = tmp_path / "broken.pdf"
+        broken_pdf.write_bytes(b"not a pdf")
 
+        with patch("ocrbridge.engines.ocrmac.engine._load_ocrmac", return_value=mock_ocrmac_module):
             with pytest.raises(OCRProcessingError) as exc_info:
-                engine.process(tmp_path)
+                engine._process_pdf(broken_pdf, OcrmacParams())
 
-            assert "only available on macOS" in str(exc_info.value)
+        assert "PDF conversion failed" in str(exc_info.value)
+        mock_ocrmac_module.OCR.assert_not_called()
 
-    @patch("platform.system", return_value="Darwin")
-    def test_process_uses_default_params(self, mock_system: Mock) -> None:
-        """Test that process uses default params when none provided."""
+    @pytest.mark.parametrize("level", [RecognitionLevel.BALANCED, RecognitionLevel.LIVETEXT])
+    def test_pdf_closed_right_after_page_failure(
+        self, level: RecognitionLevel, mock_ocrmac_module: Mock, sample_pdf_en: Path
+    ) -> None:
+        """Test that a failed page closes the PDF without waiting for garbage collection."""
         engine = OcrmacEngine()
+        close = pdfium.PdfDocument.close
+        closed: list[bool] = []
 
-        # Create a temporary image file
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as tmp:
-            tmp_path = Path(tmp.name)
-            # Create a simple image
-            img = Image.new("RGB", (100, 100), color="white")
-            img.save(tmp_path)
+        def checked_close(pdf: Any) -> None:
+            closed.append(True)
+            close(pdf)
 
+        mock_ocrmac_module.OCR.return_value.recognize.side_effect = RuntimeError("vision failed")
+        gc.disable()
         try:
-            # Mock _process_image to avoid actual OCR
-            with patch.object(engine, "_process_image", return_value="<hocr></hocr>"):
-                engine.process(tmp_path)
-                # If we get here without exception, default params were used
+            with (
+                patch.object(pdfium.PdfDocument, "close", checked_close),
+                patch(
+                    "ocrbridge.engines.ocrmac.engine._load_ocrmac", return_value=mock_ocrmac_module
+                ),
+            ):
+                with pytest.raises(RuntimeError, match="vision failed"):
+                    engine._process_pdf(
+                        sample_pdf_en, OcrmacParams(recognition_level=level, dpi=72)
+                    )
+
+                assert closed == [True]
         finally:
-            tmp_path.unlink(missing_ok=True)
+            gc.enable()
 
-    @patch("platform.system", return_value="Darwin")
-    @patch("platform.mac_ver", return_value=("13.0", ("", "", ""), ""))
-    def test_process_validates_livetext(self, mock_mac_ver: Mock, mock_system: Mock) -> None:
-        """Test that process validates LiveText requirements."""
+    def test_pdf_rendering_overlaps_ocr_up_to_pending_bound(self, mock_ocrmac_module: Mock) -> None:
+        """Test that pages render while OCR runs, but only up to the pending-page bound."""
         engine = OcrmacEngine()
-        params = OcrmacParams(recognition_level=RecognitionLevel.LIVETEXT)
+        shared_executor = engine._page_executor
+        engine._page_executor = ThreadPoolExecutor(max_workers=1)
+        rendered = 0
+        blocked_at: list[int] = []
+        renderer_blocked = threading.Condition()
+        finish_ocr = threading.Event()
+
+        class PendingSlots(threading.BoundedSemaphore):
+            def acquire(self, blocking: bool = True, timeout: float | None = None) -> bool:
+                if super().acquire(blocking=False):
+                    return True
+                with renderer_blocked:
+                    blocked_at.append(rendered)
+                    renderer_blocked.notify_all()
+                return super().acquire(blocking, timeout)
+
+        def render_pages(pdf_path: Path, dpi: int) -> Iterator[Image.Image]:
+            nonlocal rendered
+            for _ in range(8):
+                rendered += 1
+                yield Image.new("RGB", (100, 200), color="white")
+
+        def recognize() -> list[Any]:
+            assert finish_ocr.wait(timeout=5)
+            return []
+
+        engine._pending_pages = PendingSlots(engine_module._MAX_PENDING_PAGES)
+        mock_ocrmac_module.OCR.return_value.recognize.side_effect = recognize
+        bound = 1 + engine_module._MAX_PENDING_PAGES
+        try:
+            with (
+                patch.object(engine, "_render_pdf_pages", side_effect=render_pages),
+                patch(
+                    "ocrbridge.engines.ocrmac.engine._load_ocrmac", return_value=mock_ocrmac_module
+                ),
+                ThreadPoolExecutor(max_workers=1) as caller,
+            ):
+                result = caller.submit(
+                    engine._process_pdf, Path("document.pdf"), OcrmacParams(concurrency=8)
+                )
+                # Page 1 is being recognized; the renderer runs ahead by the pending
+                # pages and then waits for a slot that only a finished page frees
+                with renderer_blocked:
+                    assert renderer_blocked.wait_for(lambda: bound in blocked_at, timeout=5), (
+                        blocked_at
+                    )
+                assert rendered == bound
+                assert mock_ocrmac_module.OCR.return_value.recognize.call_count == 1
+                finish_ocr.set()
+                pages = ET.fromstring(result.result(timeout=5)).findall(PAGE_XPATH)
+        finally:
+            finish_ocr.set()
+            engine._page_executor.shutdown()
+            shared_executor.shutdown()
 
-        with tempfile.NamedTemporaryFile(suffix=".jpg") as tmp:
-            tmp_path = Path(tmp.name)
+        assert len(pages) == 8
 
-            with pytest.raises(OCRProcessingError) as exc_info:
-                engine.process(tmp_path, params)
+    def test_livetext_pdf_pages_stay_on_calling_thread(self, mock_ocrmac_module: Mock) -> None:
+        """Test that LiveText pages are recognized on the calling thread, in order."""
+        engine = OcrmacEngine()
+        images = [Image.new("RGB", (100 + i, 200), color="white") for i in range(3)]
+        threads: list[int] = []
 
-            assert "LiveText requires macOS Sonoma" in str(exc_info.value)
+        def recognize() -> list[Any]:
+            threads.append(threading.get_ident())
+            return []
 
-    @patch("platform.system", return_value="Darwin")
-    def test_process_routes_to_pdf_handler(self, mock_system: Mock) -> None:
-        """Test that PDF files are routed to _process_pdf."""
+        mock_ocrmac_module.OCR.return_value.recognize.side_effect = recognize
+
+        with (
+            patch.object(engine, "_render_pdf_pages", return_value=(image for image in images)),
+            patch("ocrbridge.engines.ocrmac.engine._load_ocrmac", return_value=mock_ocrmac_module),
+        ):
+            result = engine._process_pdf(
+                Path("document.pdf"), OcrmacParams(recognition_level=RecognitionLevel.LIVETEXT)
+            )
+
+        assert threads == [threading.get_ident()] * 3
+        pages = ET.fromstring(result).findall(PAGE_XPATH)
+        assert [page.attrib.get("id") for page in pages] == ["page_1", "page_2", "page_3"]
+
+    def test_pdf_stops_rendering_after_page_failure(self, mock_ocrmac_module: Mock) -> None:
+        """Test that the first failed page stops rendering and closes the renderer."""
         engine = OcrmacEngine()
+        rendered = 0
+        closed = False
+
+        def render_pages(pdf_path: Path, dpi: int) -> Iterator[Image.Image]:
+            nonlocal rendered, closed
+            try:
+                for _ in range(5):
+                    rendered += 1
+                    yield Image.new("RGB", (100, 200), color="white")
+            finally:
+                closed = True
+
+        mock_ocrmac_module.OCR.return_value.recognize.side_effect = RuntimeError("vision failed")
+        with (
+            patch.object(engine, "_render_pdf_pages", side_effect=render_pages),
+            patch("ocrbridge.engines.ocrmac.engine._load_ocrmac", return_value=mock_ocrmac_module),
+        ):
+            with pytest.raises(RuntimeError, match="vision failed"):
+                engine._process_pdf(Path("document.pdf"), OcrmacParams(concurrency=1))
+
+        assert rendered == 1
+        assert closed
+        mock_ocrmac_module.OCR.return_value.recognize.assert_called_once()
 
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
-            tmp_path = Path(tmp.name)
 
+class TestOcrmacImport:
+    """Tests for the cached ocrmac import."""
+
+    def test_ocrmac_imported_once(self, mock_ocrmac_module: Mock) -> None:
+        """Test that ocrmac is imported on first use and then reused."""
+        _load_ocrmac.cache_clear()
         try:
-            with patch.object(engine, "_process_pdf", return_value="<hocr></hocr>") as mock_pdf:
-                engine.process(tmp_path)
-                mock_pdf.assert_called_once()
+            with patch("importlib.import_module", return_value=mock_ocrmac_module) as mock_import:
+                assert _load_ocrmac() is mock_ocrmac_module
+                assert _load_ocrmac() is mock_ocrmac_module
+                mock_import.assert_called_once_with("ocrmac.ocrmac")
         finally:
-            tmp_path.unlink(missing_ok=True)
+            _load_ocrmac.cache_clear()
 
-    @patch("platform.system", return_value="Darwin")
-    def test_process_routes_to_image_handler(self, mock_system: Mock) -> None:
-        """Test that image files are routed to _process_image."""
+    def test_missing_ocrmac_raises(self) -> None:
+        """Test that a missing ocrmac install raises OCRProcessingError."""
+        _load_ocrmac.cache_clear()
+        try:
+            with patch("importlib.import_module", side_effect=ImportError("no ocrmac")):
+                with pytest.raises(OCRProcessingError) as exc_info:
+                    _load_ocrmac()
+
+            assert "ocrmac not installed" in str(exc_info.value)
+        finally:
+            _load_ocrmac.cache_clear()
+
+
+class TestProcessMany:
+    """Tests for batch processing."""
+
+    def test_process_many_keeps_input_order(self) -> None:
+        """Test that results are returned in input order."""
+        engine = OcrmacEngine()
+        paths = [Path(f"page_{i}.jpg") for i in range(5)]
+        params = OcrmacParams(recognition_level=RecognitionLevel.FAST)
+
+        with (
+            patch.object(engine, "warmup") as mock_warmup,
+            patch.object(
+                engine,
+                "process",
+                side_effect=lambda path, params=None: f"<hocr>{path.name}</hocr>",
+            ) as mock_process,
+        ):
+            results = engine.process_many(paths, params, max_workers=3)
+
+        assert results == [f"<hocr>page_{i}.jpg</hocr>" for i in range(5)]
+        mock_warmup.assert_called_once_with(params)
+        assert mock_process.call_count == 5
+        for call in mock_process.call_args_list:
+            assert call.kwargs["params"] is params
+
+    def test_process_many_livetext_stays_on_calling_thread(self) -> None:
+        """Test that LiveText documents are processed one by one on the calling thread."""
         engine = OcrmacEngine()
+        paths = [Path(f"page_{i}.jpg") for i in range(3)]
+        params = OcrmacParams(recognition_level=RecognitionLevel.LIVETEXT)
+        threads: list[int] = []
 
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as tmp:
-            tmp_path = Path(tmp.name)
-            # Create a simple image
-            img = Image.new("RGB", (100, 100), color="white")
-            img.save(tmp_path)
+        def process(path: Path, params: OcrmacParams | None = None) -> str:
+            threads.append(threading.get_ident())
+            return f"<hocr>{path.name}</hocr>"
 
-        try:
-            with patch.object(engine, "_process_image", return_value="<hocr></hocr>") as mock_image:
-                engine.process(tmp_path)
-                mock_image.assert_called_once()
-        finally:
-            tmp_path.unlink(missing_ok=True)
+        with (
+            patch.object(engine, "warmup"),
+            patch.object(engine, "process", side_effect=process),
+        ):
+            results = engine.process_many(paths, params, max_workers=3)
+
+        assert results == [f"<hocr>page_{i}.jpg</hocr>" for i in range(3)]
+        assert threads == [threading.get_ident()] * 3
+
+    def test_process_many_empty(self, engine: OcrmacEngine) -> None:
+        """Test that an empty batch returns an empty list."""
+        assert engine.process_many([]) == []
+
+    def test_process_many_propagates_errors(self) -> None:
+        """Test that a failing document raises from process_many."""
+        engine = OcrmacEngine()
+
+        with (
+            patch.object(engine, "warmup"),
+            patch.object(engine, "process", side_effect=OCRProcessingError("boom")),
+        ):
+            with pytest.raises(OCRProcessingError, match="boom"):
+                engine.process_many([Path("a.jpg"), Path("b.jpg")])
+
+    def test_process_many_serializes_pdfium(
+        self,
+        mock_ocrmac_module: Mock,
+        sample_pdf_en: Path,
+        sample_pdf_de: Path,
+    ) -> None:
+        """Test that concurrent PDFs never call PDFium at the same time."""
+        engine = OcrmacEngine(_platform_system=lambda: "Darwin")
+        render = pdfium.PdfPage.render
+        active = 0
+        peak = 0
+        counter_lock = threading.Lock()
+
+        def checked_render(page: Any, *args: Any, **kwargs: Any) -> Any:
+            nonlocal active, peak
+            assert engine_module._PDFIUM_LOCK.locked()
+            with counter_lock:
+                active += 1
+                peak = max(peak, active)
+            try:
+                time.sleep(0.01)
+                return render(page, *args, **kwargs)
+            finally:
+                with counter_lock:
+                    active -= 1
+
+        with (
+            patch.object(pdfium.PdfPage, "render", checked_render),
+            patch("ocrbridge.engines.ocrmac.engine._load_ocrmac", return_value=mock_ocrmac_module),
+        ):
+            results = engine.process_many(
+                [sample_pdf_en, sample_pdf_de, sample_pdf_en, sample_pdf_de],
+                OcrmacParams(dpi=72),
+                max_workers=4,
+            )
+
+        assert peak == 1
+        assert [len(ET.fromstring(result).findall(PAGE_XPATH)) for result in results] == [2] * 4
+
+    def test_process_many_caps_concurrent_recognition(
+        self, mock_ocrmac_module: Mock, sample_pdf_en: Path, sample_pdf_de: Path
+    ) -> None:
+        """Test that documents share one page pool and never exceed the recognition slots."""
+        engine = OcrmacEngine(_platform_system=lambda: "Darwin")
+        engine._recognition_slots = threading.BoundedSemaphore(2)
+        active = 0
+        peak = 0
+        threads: set[str] = set()
+        counter_lock = threading.Lock()
+
+        def recognize() -> list[Any]:
+            nonlocal active, peak
+            with counter_lock:
+                threads.add(threading.current_thread().name)
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with counter_lock:
+                active -= 1
+            return []
+
+        mock_ocrmac_module.OCR.return_value.recognize.side_effect = recognize
+        with patch("ocrbridge.engines.ocrmac.engine._load_ocrmac", return_value=mock_ocrmac_module):
+            engine.process_many(
+                [sample_pdf_en, sample_pdf_de] * 2, OcrmacParams(dpi=72), max_workers=4
+            )
+
+        assert 0 < peak <= 2
+        page_threads = {name for name in threads if name.startswith("ocrmac-page")}
+        assert 0 < len(page_threads) <= engine._page_workers
+
+
+class TestWarmup:
+    """Tests for Vision warmup."""
+
+    def test_warmup_runs_once_per_level(self, mock_ocrmac_module: Mock) -> None:
+        """Test that warmup recognizes a tiny image once per recognition level."""
+        engine = OcrmacEngine(_platform_system=lambda: "Darwin")
+
+        with patch("ocrbridge.engines.ocrmac.engine._load_ocrmac", return_value=mock_ocrmac_module):
+            engine.warmup()
+            engine.warmup(OcrmacParams())
+            engine.warmup(OcrmacParams(recognition_level=RecognitionLevel.FAST))
+
+        assert mock_ocrmac_module.OCR.call_count == 2
+        warmup_image = mock_ocrmac_module.OCR.call_args_list[0].args[0]
+        assert isinstance(warmup_image, Image.Image)
+        assert warmup_image.size == (32, 32)
+
+    def test_warmup_failure(self, mock_ocrmac_module: Mock) -> None:
+        """Test that recognition errors during warmup raise OCRProcessingError."""
+        mock_ocrmac_module.OCR.return_value.recognize.side_effect = RuntimeError("no model")
+        engine = OcrmacEngine(_platform_system=lambda: "Darwin")
+
+        with patch("ocrbridge.engines.ocrmac.engine._load_ocrmac", return_value=mock_ocrmac_module):
+            with pytest.raises(OCRProcessingError, match="warmup failed"):
+                engine.warmup()
+
+    def test_warmup_requires_macos(self) -> None:
+        """Test that warmup enforces the macOS requirement."""
+        engine = OcrmacEngine(_platform_system=lambda: "Linux")
+
+        with pytest.raises(OCRProcessingError, match="only available on macOS"):
+            engine.warmup()
@@ -50,22 +50,13 @@ class TestOcrmacParams:
 
     # Language validation tests
 
-    def test_valid_language_codes(self) -> None:
+    @pytest.mark.parametrize(
+        "code", ["en", "en-US", "fr-FR", "zh-Hans", "zh-Hans-CN", "de-DE", "ja-JP", "pt-BR"]
+    )
+    def test_valid_language_codes(self, code: str) -> None:
         """Test valid IETF BCP 47 language codes."""
-        valid_codes = [
-            ["en"],
-            ["en-US"],
-            ["fr-FR"],
-            ["zh-Hans"],
-            ["zh-Hans-CN"],
-            ["de-DE"],
-            ["ja-JP"],
-            ["pt-BR"],
-        ]
-
-        for codes in valid_codes:
-            params = OcrmacParams(languages=codes)
-            assert params.languages == codes
+        params = OcrmacParams(languages=[code])
+        assert params.languages == [code]
 
     def test_multiple_languages(self) -> None:
         """Test setting multiple languages."""
@@ -86,25 +77,26 @@ class TestOcrmacParams:
         # Pydantic validates max_length constraint
         assert any(e["type"] == "too_long" for e in errors)
 
-    def test_invalid_language_code_format(self) -> None:
+    @pytest.mark.parametrize(
+        "code",
+        [
+            "english",  # Not BCP 47
+            "en_US",  # Underscore instead of hyphen
+            "e",  # Too short
+            "engl",  # Too long for language code
+            "en-usa",  # Region too long
+            "123",  # Numbers
+            "",  # Empty string
+        ],
+    )
+    def test_invalid_language_code_format(self, code: str) -> None:
         """Test that invalid language code format raises error."""
-        invalid_codes = [
-            ["english"],  # Not BCP 47
-            ["en_US"],  # Underscore instead of hyphen
-            ["e"],  # Too short
-            ["engl"],  # Too long for language code
-            ["en-usa"],  # Region too long
-            ["123"],  # Numbers
-            [""],  # Empty string
-        ]
-
-        for codes in invalid_codes:
-            with pytest.raises(ValidationError) as exc_info:
-                OcrmacParams(languages=codes)
-
-            # Should raise a value_error from our custom validator
-            error_str = str(exc_info.value)
-            assert "Invalid IETF BCP 47" in error_str or "value_error" in error_str
+        with pytest.raises(ValidationError) as exc_info:
+            OcrmacParams(languages=[code])
+
+        # Should raise a value_error from our custom validator
+        error_str = str(exc_info.value)
+        assert "Invalid IETF BCP 47" in error_str or "value_error" in error_str
 
     def test_empty_language_list(self) -> None:
         """Test that empty language list raises error."""
@@ -124,17 +116,41 @@ class TestOcrmacParams:
 
     # Recognition level tests
 
-    def test_all_recognition_levels(self) -> None:
+    @pytest.mark.parametrize("level", list(RecognitionLevel), ids=lambda level: level.value)
+    def test_all_recognition_levels(self, level: RecognitionLevel) -> None:
         """Test setting all recognition levels."""
-        for level in RecognitionLevel:
-            params = OcrmacParams(recognition_level=level)
-            assert params.recognition_level == level
+        params = OcrmacParams(recognition_level=level)
+        assert params.recognition_level == level
 
     def test_invalid_recognition_level(self) -> None:
         """Test that invalid recognition level raises error."""
         with pytest.raises(ValidationError):
             OcrmacParams(recognition_level="invalid")  # type: ignore[reportArgumentType]
 
+    # Concurrency tests
+
+    def test_concurrency_default(self) -> None:
+        """Test that concurrency defaults to None (CPU count)."""
+        params = OcrmacParams()
+        assert params.concurrency is None
+
+    def test_concurrency_must_be_positive(self) -> None:
+        """Test that concurrency below 1 raises error."""
+        with pytest.raises(ValidationError):
+            OcrmacParams(concurrency=0)
+
+    def test_dpi_default(self) -> None:
+        """Test that PDF pages render at 200 DPI by default."""
+        params = OcrmacParams()
+        assert params.dpi == 200
+
+    def test_dpi_out_of_range(self) -> None:
+        """Test that DPI outside 72-600 raises error."""
+        with pytest.raises(ValidationError):
+            OcrmacParams(dpi=71)
+        with pytest.raises(ValidationError):
+            OcrmacParams(dpi=601)
+
     # Serialization tests
 
     def test_model_dump(self) -> None: